@@ -5,26 +5,33 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from game_scanner import GameScanner
+
+
+def _get_scanner(data_dir):
+    """Create a GameScanner, importing it lazily so --help stays fast"""
+    from game_scanner import GameScanner
+    return GameScanner(data_dir)
 
 
 def cmd_scan(args):
     """Scan for games"""
-    scanner = GameScanner(args.data_dir)
+    from launchers import flush_console_logging, start_console_logging
+    start_console_logging()
+    scanner = _get_scanner(args.data_dir)
 
     if args.platform:
         print(f"Scanning {args.platform} games only...")
         if args.platform in scanner.scanners:
             games = scanner.scanners[args.platform].scan_games()
-            for game in games:
-                scanner.db.save_game(game)
+            flush_console_logging()
+            scanner.db.save_games(games)
             print(f"Found {len(games)} {args.platform} games")
         else:
             print(f"Unknown platform: {args.platform}")
             print("Available platforms: steam, epic, xbox")
             return
     else:
-        scanner.scan_all_games()
+        scanner.scan_all_games(parallel=True)
 
     if args.export:
         scanner.export_to_json(args.export)
@@ -32,33 +39,35 @@ def cmd_scan(args):
 
 def cmd_list(args):
     """List games"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
+    db = scanner.db
 
+    # Stream rows instead of materializing the whole library
+    count = db.count_games(args.platform)
     if args.platform:
-        games = scanner.get_games_by_platform(args.platform)
-        print(f"\n{args.platform.upper()} Games ({len(games)}):")
+        print(f"\n{args.platform.upper()} Games ({count}):")
     else:
-        games = scanner.db.get_all_games()
-        print(f"\nAll Games ({len(games)}):")
+        print(f"\nAll Games ({count}):")
 
     print("=" * 80)
 
-    for game in games:
-        print(f"\nID: {game['id']}")
-        print(f"Title: {game['title']}")
-        print(f"Platform: {game['platform']}")
-        if game.get('developer'):
-            print(f"Developer: {game['developer']}")
-        if game.get('install_directory'):
-            print(f"Location: {game['install_directory']}")
-        if game.get('description'):
+    out = sys.stdout.write
+    # Raw rows: only plain columns are printed, so skip the per-row dict copy
+    for game in db.iter_games(args.platform, raw=True):
+        out(f"\nID: {game['id']}\nTitle: {game['title']}\nPlatform: {game['platform']}\n")
+        if game['developer']:
+            out(f"Developer: {game['developer']}\n")
+        if game['install_directory']:
+            out(f"Location: {game['install_directory']}\n")
+        if game['description']:
             desc = game['description'][:100] + "..." if len(game['description']) > 100 else game['description']
-            print(f"Description: {desc}")
+            out(f"Description: {desc}\n")
+    sys.stdout.flush()
 
 
 def cmd_search(args):
     """Search for games"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
     games = scanner.db.search_games(args.query)
 
     print(f"\nSearch results for '{args.query}' ({len(games)}):")
@@ -74,7 +83,7 @@ def cmd_search(args):
 
 def cmd_info(args):
     """Show detailed game information"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
 
     if args.id:
         game = scanner.db.get_game_by_id(args.id)
@@ -126,7 +135,7 @@ def cmd_info(args):
 
 def cmd_launch(args):
     """Launch a game"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
 
     if args.id:
         scanner.launch_game(args.id)
@@ -140,7 +149,7 @@ def cmd_launch(args):
 
 def cmd_stats(args):
     """Show library statistics"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
     stats = scanner.db.get_statistics()
 
     print("\n" + "=" * 80)
@@ -156,12 +165,23 @@ def cmd_stats(args):
 
 def cmd_export(args):
     """Export game data"""
-    scanner = GameScanner(args.data_dir)
+    scanner = _get_scanner(args.data_dir)
     output_file = args.output or "games_export.json"
-    scanner.export_to_json(output_file)
+    scanner.export_to_json(output_file, ndjson=args.ndjson)
     print(f"Exported to: {output_file}")
 
 
+COMMANDS = {
+    'scan': cmd_scan,
+    'list': cmd_list,
+    'search': cmd_search,
+    'info': cmd_info,
+    'launch': cmd_launch,
+    'stats': cmd_stats,
+    'export': cmd_export,
+}
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -188,7 +208,6 @@ def main():
         '--export',
         help='Export results to JSON file'
     )
-    scan_parser.set_defaults(func=cmd_scan)
 
     # List command
     list_parser = subparsers.add_parser('list', help='List all games')
@@ -197,30 +216,25 @@ def main():
         choices=['steam', 'epic', 'xbox'],
         help='Filter by platform'
     )
-    list_parser.set_defaults(func=cmd_list)
 
     # Search command
     search_parser = subparsers.add_parser('search', help='Search for games')
     search_parser.add_argument('query', help='Search query')
-    search_parser.set_defaults(func=cmd_search)
 
     # Info command
     info_parser = subparsers.add_parser('info', help='Show detailed game information')
     info_group = info_parser.add_mutually_exclusive_group(required=True)
     info_group.add_argument('--id', type=int, help='Game database ID')
     info_group.add_argument('--title', help='Game title')
-    info_parser.set_defaults(func=cmd_info)
 
     # Launch command
     launch_parser = subparsers.add_parser('launch', help='Launch a game')
     launch_group = launch_parser.add_mutually_exclusive_group(required=True)
     launch_group.add_argument('--id', type=int, help='Game database ID')
     launch_group.add_argument('--title', help='Game title')
-    launch_parser.set_defaults(func=cmd_launch)
 
     # Stats command
-    stats_parser = subparsers.add_parser('stats', help='Show library statistics')
-    stats_parser.set_defaults(func=cmd_stats)
+    subparsers.add_parser('stats', help='Show library statistics')
 
     # Export command
     export_parser = subparsers.add_parser('export', help='Export game data to JSON')
@@ -228,7 +242,11 @@ def main():
         '--output',
         help='Output file name (default: games_export.json)'
     )
-    export_parser.set_defaults(func=cmd_export)
+    export_parser.add_argument(
+        '--ndjson',
+        action='store_true',
+        help='Write one JSON object per line instead of a single document'
+    )
 
     args = parser.parse_args()
 
@@ -237,7 +255,7 @@ def main():
         return
 
     # Execute command
-    args.func(args)
+    COMMANDS[args.command](args)
 
 
 if __name__ == '__main__':
@@ -4,30 +4,385 @@ Uses SQLite for persistent storage of game data
 """
 import sqlite3
 import json
-from typing import Dict, List, Optional
+import queue
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import chain
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['GameDatabase']
+
+
+def _dumps(obj) -> str:
+    """Serialize a JSON column value, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _loads(text: str):
+    """Parse a JSON column value, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Game fields stored in their own columns; anything else goes into metadata
+_CORE_COLUMNS = frozenset({
+    'platform', 'title', 'app_id', 'package_name', 'install_directory',
+    'launch_command', 'description', 'short_description', 'long_description',
+    'developer', 'publisher', 'release_date', 'icon_path', 'boxart_path',
+    'size_on_disk', 'last_updated', 'genres',
+})
+
+_FTS_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def _fts_query(text: str) -> str:
+    """Turn free-form user input into an FTS5 prefix query ('' if nothing searchable)"""
+    return ' '.join(f'"{token}"*' for token in _FTS_TOKEN_RE.findall(text))
+
+
+# Keys a list view can read without parsing JSON: real columns that save_game
+# never copies into metadata, so the metadata merge cannot overwrite them
+_EAGER_KEYS = (_CORE_COLUMNS - {'genres'}) | {'id'}
+# Not stored in metadata either: a game dict read back from the database
+# carries its row id, which must not shadow the id column on a later load
+_NON_METADATA_KEYS = _CORE_COLUMNS | {'id'}
+
+
+def _expanding(method):
+    """Wrap a dict method so it first parses any pending genres/metadata JSON"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.expand_metadata()
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _LazyGameDict(dict):
+    """
+    Game row that parses its genres/metadata JSON on first use.
+    Reading a plain column (title, icon_path, ...) stays cheap; any other
+    access expands the row so it matches the eagerly parsed form.
+    """
+    __slots__ = ('_raw_genres', '_raw_meta')
+
+    def __init__(self, row: sqlite3.Row):
+        super().__init__(row)
+        dict.pop(self, 'title_norm', None)
+        self._raw_genres = dict.get(self, 'genres') or None
+        self._raw_meta = dict.get(self, 'metadata') or None
+
+    def expand_metadata(self) -> 'Dict':
+        """Parse genres and merge metadata into the row (idempotent)"""
+        if self._raw_genres is not None:
+            raw, self._raw_genres = self._raw_genres, None
+            try:
+                dict.__setitem__(self, 'genres', _loads(raw))
+            except (json.JSONDecodeError, TypeError, ValueError) as e:
+                print(f"Warning: Failed to parse genres JSON: {e}")
+                dict.__setitem__(self, 'genres', [])
+
+        if self._raw_meta is not None:
+            raw, self._raw_meta = self._raw_meta, None
+            try:
+                dict.update(self, _loads(raw))
+            except (json.JSONDecodeError, TypeError, ValueError) as e:
+                print(f"Warning: Failed to parse metadata JSON: {e}")
+
+        return self
+
+    def __getitem__(self, key):
+        if key not in _EAGER_KEYS:
+            self.expand_metadata()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key not in _EAGER_KEYS:
+            self.expand_metadata()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        if key not in _EAGER_KEYS:
+            self.expand_metadata()
+        return dict.__contains__(self, key)
+
+    __iter__ = _expanding(dict.__iter__)
+    __len__ = _expanding(dict.__len__)
+    __repr__ = _expanding(dict.__repr__)
+    __eq__ = _expanding(dict.__eq__)
+    __ne__ = _expanding(dict.__ne__)
+    __or__ = _expanding(dict.__or__)
+    __ior__ = _expanding(dict.__ior__)
+    __setitem__ = _expanding(dict.__setitem__)
+    __delitem__ = _expanding(dict.__delitem__)
+    keys = _expanding(dict.keys)
+    values = _expanding(dict.values)
+    items = _expanding(dict.items)
+    pop = _expanding(dict.pop)
+    popitem = _expanding(dict.popitem)
+    setdefault = _expanding(dict.setdefault)
+    update = _expanding(dict.update)
+    copy = _expanding(dict.copy)
+
+    def __reduce__(self):
+        return dict, (dict(self.expand_metadata()),)
+
+
+# Fixed SQL text, kept as constants so every call hits sqlite3's statement cache
+# Plain columns written by save_game, with the value used when a field is missing;
+# genres and metadata (JSON) follow them in the INSERT
+_INSERT_COLUMN_DEFAULTS = (
+    ('platform', ''), ('title', ''), ('app_id', ''), ('package_name', ''),
+    ('install_directory', ''), ('launch_command', ''), ('description', ''),
+    ('short_description', ''), ('long_description', ''), ('developer', ''),
+    ('publisher', ''), ('release_date', ''), ('icon_path', ''), ('boxart_path', ''),
+    ('size_on_disk', 0), ('last_updated', 0),
+)
+_INSERT_COLUMNS = tuple(column for column, _ in _INSERT_COLUMN_DEFAULTS) + ('genres', 'metadata')
+
+# Positional binding avoids a parameter-name lookup per column per row
+_SQL_INSERT_PREFIX = 'INSERT OR REPLACE INTO games (' + ', '.join(_INSERT_COLUMNS) + ', updated_at) VALUES '
+_SQL_INSERT_ROW = '(' + ', '.join('?' * len(_INSERT_COLUMNS)) + ', CURRENT_TIMESTAMP)'
+_SQL_INSERT_GAME = _SQL_INSERT_PREFIX + _SQL_INSERT_ROW
+# save_games writes full chunks with one multi-row statement; 999 is the
+# SQLITE_MAX_VARIABLE_NUMBER default on builds older than 3.32
+_INSERT_ROWS_PER_STATEMENT = 999 // len(_INSERT_COLUMNS)
+_SQL_INSERT_GAMES_MULTI = _SQL_INSERT_PREFIX + ', '.join([_SQL_INSERT_ROW] * _INSERT_ROWS_PER_STATEMENT)
+_SQL_GAME_ID_BY_KEY = 'SELECT id FROM games WHERE platform = ? AND title = ?'
+_SQL_GET_BY_ID = 'SELECT * FROM games WHERE id = ?'
+_SQL_GET_BY_TITLE_FTS = '''
+    SELECT g.* FROM games g
+    JOIN games_fts f ON f.rowid = g.id
+    WHERE games_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT 1
+'''
+_SQL_GET_BY_TITLE_LIKE = 'SELECT * FROM games WHERE title LIKE ?'
+_SQL_ALL_GAMES = 'SELECT * FROM games ORDER BY platform, title'
+_SQL_GAMES_BY_PLATFORM = 'SELECT * FROM games WHERE platform = ? ORDER BY title'
+_SQL_COUNT_ALL = 'SELECT COUNT(*) FROM games'
+_SQL_COUNT_BY_PLATFORM = 'SELECT COUNT(*) FROM games WHERE platform = ?'
+_SQL_SEARCH_FTS = '''
+    SELECT g.* FROM games g
+    JOIN games_fts f ON f.rowid = g.id
+    WHERE games_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+'''
+# Title-prefix LIKE can range-scan idx_title_nocase; '%q%' always scans the table
+_SQL_SEARCH_PREFIX = 'SELECT * FROM games WHERE title LIKE ? ORDER BY title COLLATE NOCASE LIMIT ?'
+_SQL_SEARCH_LIKE = '''
+    SELECT * FROM games
+    WHERE title LIKE ? OR description LIKE ?
+    ORDER BY title
+'''
+_SQL_DELETE_GAME = 'DELETE FROM games WHERE id = ?'
+# The three home-screen lists in one statement; each arm matches its get_* method
+_SQL_HOME_LISTS = '''
+    SELECT 'recently_played' AS bucket, * FROM (
+        SELECT * FROM games
+        WHERE last_played IS NOT NULL AND is_hidden = 0
+        ORDER BY last_played DESC
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT 'most_played', * FROM (
+        SELECT * FROM games
+        WHERE total_play_time > 0 AND is_hidden = 0
+        ORDER BY total_play_time DESC
+        LIMIT ?
+    )
+    UNION ALL
+    SELECT 'recently_added', * FROM (
+        SELECT * FROM games
+        WHERE is_hidden = 0
+        ORDER BY created_at DESC
+        LIMIT ?
+    )
+'''
+
+
+# Columns filter_games may sort by (interpolated into SQL, so whitelist only)
+_VALID_SORT = frozenset({
+    'title', 'last_played', 'total_play_time', 'launch_count', 'created_at', 'release_date',
+})
+# Sort columns that can be NULL; those rows are ordered last
+_NULLABLE_SORT = frozenset({'last_played', 'release_date'})
+
+
+@lru_cache(maxsize=64)
+def _filter_games_sql(show_hidden: bool, favorites_only: bool, by_platform: bool,
+                      search_mode: Optional[str], by_genre: bool,
+                      sort_by: str, sort_order: str) -> str:
+    """Assemble filter_games SQL for one argument shape (sort fields must be pre-validated)"""
+    query = 'SELECT * FROM games WHERE 1=1'
+
+    if not show_hidden:
+        query += ' AND is_hidden = 0'
+
+    if favorites_only:
+        query += ' AND is_favorite = 1'
+
+    if by_platform:
+        query += ' AND platform = ?'
+
+    if search_mode == 'fts':
+        query += ' AND id IN (SELECT rowid FROM games_fts WHERE games_fts MATCH ?)'
+    elif search_mode == 'like':
+        query += ' AND (title LIKE ? OR description LIKE ? OR developer LIKE ?)'
+
+    if by_genre:
+        query += ' AND genres LIKE ?'
+
+    # Handle NULL values in sorting
+    if sort_by in _NULLABLE_SORT:
+        query += ' ORDER BY ' + sort_by + ' IS NULL, ' + sort_by + ' ' + sort_order
+    else:
+        query += ' ORDER BY ' + sort_by + ' ' + sort_order
+
+    return query
+
+
+# Idle read-only connections kept per database
+READ_POOL_SIZE = 4
+
+
+def _writer(method):
+    """Run a write method inside a (possibly enclosing) batch() transaction"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.batch():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class GameDatabase:
     """SQLite database for storing game information"""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, synchronous: str = 'NORMAL'):
         """
         Initialize the database
 
         Args:
             db_path: Path to SQLite database file
+            synchronous: SQLite synchronous level ('NORMAL' is safe under WAL,
+                'OFF' trades crash durability for faster bulk imports)
         """
+        if synchronous.upper() not in ('OFF', 'NORMAL', 'FULL'):
+            raise ValueError(f"Invalid synchronous level: {synchronous}")
         self.db_path = db_path
+        self.synchronous = synchronous.upper()
         self.conn = None
+        self.has_fts = False
+        self.title_norm_expr = 'LOWER(TRIM(title))'
+        self._write_lock = threading.RLock()
+        self._batch_depth = 0
+        self._batch_thread = None  # Thread ident of the open batch() transaction
+        self._read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+        # In-memory databases are private to one connection, so reads use the writer
+        self._pool_reads = db_path != ':memory:' and not db_path.startswith('file::memory:')
         self._connect()
         self._create_tables()
 
     def _connect(self):
-        """Establish database connection"""
+        """Establish the write connection"""
         if self.conn is None:
-            self.conn = sqlite3.connect(self.db_path)
+            # Shared across threads (e.g. Flask handlers); writes hold _write_lock
+            # Autocommit mode: batch() issues BEGIN IMMEDIATE/COMMIT explicitly, so
+            # reads on this connection don't open implicit transactions
+            self.conn = sqlite3.connect(self.db_path, cached_statements=512, check_same_thread=False,
+                                        isolation_level=None)
             self.conn.row_factory = sqlite3.Row
+            # WAL turns each commit into a single journal append instead of
+            # several fsyncs; it persists in the database file once set
+            self.conn.executescript(f'''
+                PRAGMA journal_mode = WAL;
+                PRAGMA synchronous = {self.synchronous};
+                PRAGMA temp_store = MEMORY;
+                PRAGMA cache_size = -64000;
+                PRAGMA mmap_size = 268435456;
+                PRAGMA recursive_triggers = ON;
+            ''')
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection; under WAL it never blocks the writer"""
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, cached_statements=512, check_same_thread=False,
+                               isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.executescript('''
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -16000;
+            PRAGMA mmap_size = 268435456;
+        ''')
+        return conn
+
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into a single transaction (one commit)
+
+        Write methods called inside the block join it instead of committing
+        individually; the outermost block commits, or rolls back on error.
+        """
+        with self._write_lock:
+            if self._batch_depth == 0:
+                # Take the write lock up front rather than upgrading mid-transaction
+                self.conn.execute('BEGIN IMMEDIATE')
+                self._batch_thread = threading.get_ident()
+            self._batch_depth += 1
+            try:
+                yield self
+                if self._batch_depth == 1:
+                    self.conn.execute('COMMIT')
+            except BaseException:
+                if self._batch_depth == 1 and self.conn.in_transaction:
+                    self.conn.execute('ROLLBACK')
+                raise
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._batch_thread = None
+
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Borrow a cursor for SELECT-only work from the read connection pool
+
+        Inside this thread's batch() the writer is used instead, so reads see
+        the transaction's own uncommitted changes.
+        """
+        if not self._pool_reads or self._batch_thread == threading.get_ident():
+            with self._write_lock:
+                yield self.conn.cursor()
+            return
+
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_reader()
+
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            # Finalize any half-read statement so the connection holds no stale snapshot
+            cursor.close()
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
     def _create_tables(self):
         """Create database tables if they don't exist"""
@@ -68,7 +423,9 @@ class GameDatabase:
             )
         ''')
 
-        # Index for faster lookups
+        # Index for faster lookups. Exact platform/title lookups and the
+        # platform-then-title listings are served by the UNIQUE(platform, title)
+        # index; title search uses idx_title_nocase and games_fts (below).
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_platform ON games(platform)
         ''')
@@ -85,6 +442,11 @@ class GameDatabase:
             CREATE INDEX IF NOT EXISTS idx_is_favorite ON games(is_favorite)
         ''')
 
+        # Case-insensitive index so title-prefix LIKE searches can range-scan
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_title_nocase ON games(title COLLATE NOCASE)
+        ''')
+
         # Index for optimized duplicate detection
         cursor.execute('''
             CREATE INDEX IF NOT EXISTS idx_title_normalized ON games(LOWER(TRIM(title)))
@@ -106,6 +468,30 @@ class GameDatabase:
             CREATE INDEX IF NOT EXISTS idx_game_sessions_game_id ON game_sessions(game_id)
         ''')
 
+        # Partial indexes matching the visible-games sort queries
+        # (recently played / most played / recently added), so LIMIT queries
+        # walk the index instead of sorting the whole table
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_visible_last_played ON games(last_played DESC)
+            WHERE is_hidden = 0 AND last_played IS NOT NULL
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_visible_play_time ON games(total_play_time DESC)
+            WHERE is_hidden = 0 AND total_play_time > 0
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_visible_created ON games(created_at DESC)
+            WHERE is_hidden = 0
+        ''')
+
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_sessions_game_start ON game_sessions(game_id, start_time)
+        ''')
+
+        self._create_fts(cursor)
+
         # Migrate existing database (add new columns if they don't exist)
         # Check if columns exist by trying to add them
         migration_columns = [
@@ -125,8 +511,102 @@ class GameDatabase:
                 # Column already exists
                 pass
 
-        self.conn.commit()
+        self._create_title_norm(cursor)
 
+        # Roll finished session durations into games.total_play_time. TEMP so it
+        # only fires for this connection: the Electron app shares this database
+        # and updates total_play_time itself
+        cursor.execute('''
+            CREATE TEMP TRIGGER IF NOT EXISTS trg_session_end
+            AFTER UPDATE OF end_time ON game_sessions
+            WHEN NEW.end_time IS NOT NULL AND OLD.end_time IS NULL
+            BEGIN
+                UPDATE games
+                SET total_play_time = total_play_time + COALESCE(NEW.duration, 0)
+                WHERE id = NEW.game_id;
+            END
+        ''')
+
+    def _create_title_norm(self, cursor: sqlite3.Cursor):
+        """Add an indexed, generated normalized-title column (SQLite 3.31+)"""
+        try:
+            cursor.execute('''
+                ALTER TABLE games ADD COLUMN title_norm TEXT
+                GENERATED ALWAYS AS (LOWER(TRIM(title))) VIRTUAL
+            ''')
+        except sqlite3.OperationalError:
+            # Column already exists, or generated columns are unsupported
+            pass
+
+        cursor.execute('PRAGMA table_xinfo(games)')
+        if any(row['name'] == 'title_norm' for row in cursor.fetchall()):
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_title_norm ON games(title_norm)')
+            self.title_norm_expr = 'title_norm'
+        else:
+            # Older SQLite: the expression index idx_title_normalized covers this
+            self.title_norm_expr = 'LOWER(TRIM(title))'
+
+    def _create_fts(self, cursor: sqlite3.Cursor):
+        """Create the FTS5 search index and its sync triggers, if FTS5 is available"""
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'games_fts'")
+        row = cursor.fetchone()
+        if row is not None and 'content=' not in row['sql'].replace(' ', '').lower():
+            # Older layout kept its own copy of the text; replace it
+            cursor.executescript('''
+                DROP TRIGGER IF EXISTS games_fts_insert;
+                DROP TRIGGER IF EXISTS games_fts_delete;
+                DROP TRIGGER IF EXISTS games_fts_update;
+                DROP TABLE games_fts;
+            ''')
+            row = None
+
+        try:
+            # External content: the index reads title/description/developer
+            # from games itself instead of storing a second copy
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+                    title, description, developer,
+                    content = 'games', content_rowid = 'id',
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            print(f"Warning: FTS5 unavailable, falling back to LIKE search: {e}")
+            return
+
+        cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS games_fts_insert AFTER INSERT ON games BEGIN
+                INSERT INTO games_fts(rowid, title, description, developer)
+                VALUES (new.id, new.title, new.description, new.developer);
+            END;
+            CREATE TRIGGER IF NOT EXISTS games_fts_delete AFTER DELETE ON games BEGIN
+                INSERT INTO games_fts(games_fts, rowid, title, description, developer)
+                VALUES ('delete', old.id, old.title, old.description, old.developer);
+            END;
+            CREATE TRIGGER IF NOT EXISTS games_fts_update
+            AFTER UPDATE OF title, description, developer ON games BEGIN
+                INSERT INTO games_fts(games_fts, rowid, title, description, developer)
+                VALUES ('delete', old.id, old.title, old.description, old.developer);
+                INSERT INTO games_fts(rowid, title, description, developer)
+                VALUES (new.id, new.title, new.description, new.developer);
+            END;
+        ''')
+
+        # The Electron app writes games with INSERT OR REPLACE and recursive
+        # triggers off, so the delete trigger misses replaced rows and their
+        # index entries linger. The index's row count (its docsize table) then
+        # differs from games; rebuilding from the content table fixes that, as
+        # well as backfilling a newly created index
+        needs_rebuild = row is None
+        if not needs_rebuild:
+            cursor.execute('SELECT (SELECT COUNT(*) FROM games_fts_docsize) != (SELECT COUNT(*) FROM games)')
+            needs_rebuild = bool(cursor.fetchone()[0])
+        if needs_rebuild:
+            cursor.execute("INSERT INTO games_fts(games_fts) VALUES ('rebuild')")
+
+        self.has_fts = True
+
+    @_writer
     def save_game(self, game_data: Dict) -> int:
         """
         Save or update game information
@@ -137,136 +617,171 @@ class GameDatabase:
         Returns:
             The ID of the saved game
         """
-        cursor = self.conn.cursor()
-
-        # Convert lists to JSON strings
-        genres = json.dumps(game_data.get('genres', []))
+        return self.conn.execute(_SQL_INSERT_GAME, self._game_params(game_data)).lastrowid
 
-        # Store additional metadata as JSON
-        metadata_fields = {}
-        for key, value in game_data.items():
-            if key not in ['platform', 'title', 'app_id', 'package_name', 'install_directory',
-                          'launch_command', 'description', 'short_description', 'long_description',
-                          'developer', 'publisher', 'release_date', 'icon_path', 'boxart_path',
-                          'size_on_disk', 'last_updated', 'genres']:
-                metadata_fields[key] = value
-
-        metadata = json.dumps(metadata_fields)
-
-        # Prepare data
-        data = {
-            'platform': game_data.get('platform', ''),
-            'title': game_data.get('title', ''),
-            'app_id': game_data.get('app_id', ''),
-            'package_name': game_data.get('package_name', ''),
-            'install_directory': game_data.get('install_directory', ''),
-            'launch_command': game_data.get('launch_command', ''),
-            'description': game_data.get('description', ''),
-            'short_description': game_data.get('short_description', ''),
-            'long_description': game_data.get('long_description', ''),
-            'developer': game_data.get('developer', ''),
-            'publisher': game_data.get('publisher', ''),
-            'release_date': game_data.get('release_date', ''),
-            'icon_path': game_data.get('icon_path', ''),
-            'boxart_path': game_data.get('boxart_path', ''),
-            'size_on_disk': game_data.get('size_on_disk', 0),
-            'last_updated': game_data.get('last_updated', 0),
-            'genres': genres,
-            'metadata': metadata
-        }
-
-        # Insert or replace
-        cursor.execute('''
-            INSERT OR REPLACE INTO games (
-                platform, title, app_id, package_name, install_directory,
-                launch_command, description, short_description, long_description,
-                developer, publisher, release_date, icon_path, boxart_path,
-                size_on_disk, last_updated, genres, metadata, updated_at
-            ) VALUES (
-                :platform, :title, :app_id, :package_name, :install_directory,
-                :launch_command, :description, :short_description, :long_description,
-                :developer, :publisher, :release_date, :icon_path, :boxart_path,
-                :size_on_disk, :last_updated, :genres, :metadata, CURRENT_TIMESTAMP
-            )
-        ''', data)
+    @_writer
+    def save_games(self, games: List[Dict]) -> List[int]:
+        """
+        Save or update many games in a single transaction
 
-        self.conn.commit()
-        return cursor.lastrowid
+        Args:
+            games: List of dictionaries containing game information
 
-    def get_game_by_id(self, game_id: int) -> Optional[Dict]:
-        """Get a game by its database ID"""
+        Returns:
+            The IDs of the saved games, in input order
+        """
+        rows = [self._game_params(game_data) for game_data in games]
         cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games WHERE id = ?', (game_id,))
-        row = cursor.fetchone()
 
-        if row:
-            return self._row_to_dict(row)
-        return None
+        # Full chunks go through one multi-row INSERT each, the remainder row by row
+        step = _INSERT_ROWS_PER_STATEMENT
+        bulk_end = len(rows) - len(rows) % step
+        for start in range(0, bulk_end, step):
+            cursor.execute(_SQL_INSERT_GAMES_MULTI, list(chain.from_iterable(rows[start:start + step])))
+        cursor.executemany(_SQL_INSERT_GAME, rows[bulk_end:])
 
-    def get_game_by_title(self, title: str) -> Optional[Dict]:
-        """Get a game by its title"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games WHERE title LIKE ?', (f'%{title}%',))
-        row = cursor.fetchone()
+        ids = []
+        for row in rows:
+            # platform and title are the first two INSERT columns
+            cursor.execute(_SQL_GAME_ID_BY_KEY, row[:2])
+            ids.append(cursor.fetchone()['id'])
+        return ids
 
-        if row:
-            return self._row_to_dict(row)
-        return None
+    def _game_params(self, game_data: Dict) -> tuple:
+        """Build the positional INSERT parameters for a game dictionary"""
+        get = game_data.get
+        params = [get(column, default) for column, default in _INSERT_COLUMN_DEFAULTS]
 
-    def get_games_by_platform(self, platform: str) -> List[Dict]:
-        """Get all games from a specific platform"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games WHERE platform = ? ORDER BY title', (platform,))
-        rows = cursor.fetchall()
+        # Convert lists to JSON strings
+        params.append(_dumps(get('genres', [])))
 
-        return [self._row_to_dict(row) for row in rows]
+        # Store additional metadata as JSON
+        params.append(_dumps({k: v for k, v in game_data.items() if k not in _NON_METADATA_KEYS}))
 
-    def get_all_games(self) -> List[Dict]:
-        """Get all games from the database"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games ORDER BY platform, title')
-        rows = cursor.fetchall()
+        return tuple(params)
 
-        return [self._row_to_dict(row) for row in rows]
+    def get_game_by_id(self, game_id: int) -> Optional[Dict]:
+        """Get a game by its database ID"""
+        with self._read_cursor() as cursor:
+            cursor.execute(_SQL_GET_BY_ID, (game_id,))
+            row = cursor.fetchone()
 
-    def search_games(self, query: str) -> List[Dict]:
-        """Search games by title or description"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM games
-            WHERE title LIKE ? OR description LIKE ?
-            ORDER BY title
-        ''', (f'%{query}%', f'%{query}%'))
-        rows = cursor.fetchall()
+            if row:
+                return self._row_to_dict(row)
+            return None
 
-        return [self._row_to_dict(row) for row in rows]
+    def get_game_by_title(self, title: str) -> Optional[Dict]:
+        """Get a game by its title"""
+        with self._read_cursor() as cursor:
+            # Prefer a case-insensitive exact title match (index lookup)
+            cursor.execute(f'SELECT * FROM games WHERE {self.title_norm_expr} = LOWER(TRIM(?)) LIMIT 1',
+                           (title,))
+            row = cursor.fetchone()
+            if row:
+                return self._row_to_dict(row)
+
+            match = _fts_query(title) if self.has_fts else ''
+            if match:
+                cursor.execute(_SQL_GET_BY_TITLE_FTS, (f'title : ({match})',))
+            else:
+                cursor.execute(_SQL_GET_BY_TITLE_LIKE, (f'%{title}%',))
+            row = cursor.fetchone()
+
+            if row:
+                return self._row_to_dict(row)
+            return None
+
+    def get_games_by_platform(self, platform: str, raw: bool = False) -> List[Dict]:
+        """Get all games from a specific platform (sqlite3.Row objects if raw)"""
+        return list(self.iter_games(platform, raw=raw))
+
+    def get_all_games(self, raw: bool = False) -> List[Dict]:
+        """Get all games from the database (sqlite3.Row objects if raw)"""
+        return list(self.iter_games(raw=raw))
+
+    def iter_games(self, platform: Optional[str] = None, raw: bool = False) -> Iterator[Dict]:
+        """
+        Yield games one row at a time, optionally filtered by platform.
+        With raw=True the sqlite3.Row objects are yielded as-is: indexable by
+        column name but read-only, with genres/metadata left as JSON text.
+        """
+        with self._read_cursor() as cursor:
+            if platform:
+                cursor.execute(_SQL_GAMES_BY_PLATFORM, (platform,))
+            else:
+                cursor.execute(_SQL_ALL_GAMES)
+
+            if raw:
+                yield from cursor
+            else:
+                for row in cursor:
+                    yield self._row_to_dict(row)
+
+    def count_games(self, platform: Optional[str] = None) -> int:
+        """Count games, optionally filtered by platform"""
+        with self._read_cursor() as cursor:
+            if platform:
+                cursor.execute(_SQL_COUNT_BY_PLATFORM, (platform,))
+            else:
+                cursor.execute(_SQL_COUNT_ALL)
+            return cursor.fetchone()[0]
+
+    def search_games(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search games by title or description
 
+        Args:
+            query: Free-form search text
+            limit: Maximum number of results (all matches if None)
+        """
+        sql_limit = -1 if limit is None else limit
+        with self._read_cursor() as cursor:
+            match = _fts_query(query) if self.has_fts else ''
+            if match:
+                cursor.execute(_SQL_SEARCH_FTS, (f'{{title description}} : ({match})', sql_limit))
+                return [self._row_to_dict(row) for row in cursor]
+
+            # Without FTS: title-prefix hits first (index range scan), then the
+            # remaining substring matches if the caller wants more
+            results = []
+            # Dedupe on the raw rows' ids: reading 'id' from a lazy game dict
+            # would parse its JSON columns
+            seen = set()
+            if query and '%' not in query and '_' not in query:
+                cursor.execute(_SQL_SEARCH_PREFIX, (f'{query}%', sql_limit))
+                rows = cursor.fetchall()
+                seen.update(row['id'] for row in rows)
+                results = [self._row_to_dict(row) for row in rows]
+                if limit is not None and len(results) >= limit:
+                    return results
+
+            cursor.execute(_SQL_SEARCH_LIKE, (f'%{query}%', f'%{query}%'))
+            for row in cursor:
+                if row['id'] not in seen:
+                    results.append(self._row_to_dict(row))
+                    if limit is not None and len(results) >= limit:
+                        break
+            return results
+
+    @_writer
     def delete_game(self, game_id: int) -> bool:
         """Delete a game from the database"""
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM games WHERE id = ?', (game_id,))
-        self.conn.commit()
-        return cursor.rowcount > 0
+        return self.conn.execute(_SQL_DELETE_GAME, (game_id,)).rowcount > 0
 
     def get_statistics(self) -> Dict:
         """Get statistics about the game library"""
-        cursor = self.conn.cursor()
-
-        # Total games
-        cursor.execute('SELECT COUNT(*) as total FROM games')
-        total = cursor.fetchone()['total']
-
-        # Games per platform
-        cursor.execute('''
-            SELECT platform, COUNT(*) as count
-            FROM games
-            GROUP BY platform
-        ''')
-        platforms = {row['platform']: row['count'] for row in cursor.fetchall()}
+        with self._read_cursor() as cursor:
+            # Per-platform counts and sizes in one pass; totals are summed from these rows
+            cursor.execute('''
+                SELECT platform, COUNT(*) as count, COALESCE(SUM(size_on_disk), 0) as total_size
+                FROM games
+                GROUP BY platform
+            ''')
+            rows = cursor.fetchall()
 
-        # Total size
-        cursor.execute('SELECT SUM(size_on_disk) as total_size FROM games')
-        total_size = cursor.fetchone()['total_size'] or 0
+        platforms = {row['platform']: row['count'] for row in rows}
+        total = sum(platforms.values())
+        total_size = sum(row['total_size'] for row in rows)
 
         return {
             'total_games': total,
@@ -276,29 +791,33 @@ class GameDatabase:
         }
 
     def _row_to_dict(self, row: sqlite3.Row) -> Dict:
-        """Convert a database row to a dictionary"""
-        game = dict(row)
+        """
+        Convert a database row to a dictionary.
+        genres/metadata JSON is parsed lazily; call expand_metadata() before
+        handing the row to a C serializer such as orjson.
+        """
+        return _LazyGameDict(row)
 
-        # Parse JSON fields
-        if game.get('genres'):
+    def close(self):
+        """Close the write connection and any pooled read connections"""
+        read_pool = getattr(self, '_read_pool', None)
+        while read_pool is not None:
             try:
-                game['genres'] = json.loads(game['genres'])
-            except (json.JSONDecodeError, TypeError, ValueError) as e:
-                print(f"Warning: Failed to parse genres JSON: {e}")
-                game['genres'] = []
+                read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+            except Exception as e:
+                print(f"Warning: Error closing read connection: {e}")
 
-        if game.get('metadata'):
+        if getattr(self, 'conn', None) is not None:
             try:
-                metadata = json.loads(game['metadata'])
-                game.update(metadata)
-            except (json.JSONDecodeError, TypeError, ValueError) as e:
-                print(f"Warning: Failed to parse metadata JSON: {e}")
-
-        return game
-
-    def close(self):
-        """Close the database connection"""
-        if self.conn is not None:
+                # Refresh planner statistics for the queries this connection ran;
+                # cheap, and usually a no-op (SQLite's recommended close-time step)
+                with self._write_lock:
+                    if not self.conn.in_transaction:
+                        self.conn.execute('PRAGMA optimize')
+            except Exception as e:
+                print(f"Warning: PRAGMA optimize failed: {e}")
             try:
                 self.conn.close()
             except Exception as e:
@@ -321,6 +840,7 @@ class GameDatabase:
 
     # Play time tracking methods
 
+    @_writer
     def start_game_session(self, game_id: int) -> int:
         """Start a new game session"""
         cursor = self.conn.cursor()
@@ -337,193 +857,161 @@ class GameDatabase:
             WHERE id = ?
         ''', (game_id,))
 
-        self.conn.commit()
         return cursor.lastrowid
 
+    @_writer
     def end_game_session(self, session_id: int):
-        """End a game session and calculate duration"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
+        """End a game session; the session-end trigger adds its duration to the game"""
+        self.conn.execute('''
             UPDATE game_sessions
             SET end_time = CURRENT_TIMESTAMP,
-                duration = (julianday(CURRENT_TIMESTAMP) - julianday(start_time)) * 86400
-            WHERE id = ?
+                duration = CAST((julianday(CURRENT_TIMESTAMP) - julianday(start_time)) * 86400 AS INTEGER)
+            WHERE id = ? AND end_time IS NULL
         ''', (session_id,))
 
-        # Get the duration and game_id
-        cursor.execute('''
-            SELECT game_id, duration FROM game_sessions WHERE id = ?
-        ''', (session_id,))
-        result = cursor.fetchone()
-
-        if result:
-            game_id = result['game_id']
-            duration = result['duration']
-
-            # Update total play time
-            cursor.execute('''
-                UPDATE games
-                SET total_play_time = total_play_time + ?
-                WHERE id = ?
-            ''', (int(duration), game_id))
-
-        self.conn.commit()
-
     def get_play_time(self, game_id: int) -> Dict:
         """Get play time statistics for a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT
-                total_play_time,
-                launch_count,
-                last_played,
-                (SELECT COUNT(*) FROM game_sessions WHERE game_id = ?) as session_count
-            FROM games
-            WHERE id = ?
-        ''', (game_id, game_id))
-
-        result = cursor.fetchone()
-        if result:
-            return {
-                'total_play_time': result['total_play_time'],
-                'launch_count': result['launch_count'],
-                'last_played': result['last_played'],
-                'session_count': result['session_count'],
-                'average_session_time': result['total_play_time'] / max(result['session_count'], 1)
-            }
-        return {}
+        with self._read_cursor() as cursor:
+            cursor.execute('''
+                SELECT
+                    g.total_play_time,
+                    g.launch_count,
+                    g.last_played,
+                    s.session_count,
+                    CAST(g.total_play_time AS REAL) / MAX(s.session_count, 1) as average_session_time
+                FROM games g,
+                     (SELECT COUNT(*) as session_count FROM game_sessions WHERE game_id = ?) s
+                WHERE g.id = ?
+            ''', (game_id, game_id))
+
+            result = cursor.fetchone()
+            return dict(result) if result else {}
 
     # Favorites and hidden games methods
 
+    @_writer
     def toggle_favorite(self, game_id: int) -> bool:
         """Toggle favorite status of a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT is_favorite FROM games WHERE id = ?', (game_id,))
-        result = cursor.fetchone()
+        result = self.conn.execute('SELECT is_favorite FROM games WHERE id = ?', (game_id,)).fetchone()
 
         if result:
             new_status = 0 if result['is_favorite'] else 1
-            cursor.execute('UPDATE games SET is_favorite = ? WHERE id = ?', (new_status, game_id))
-            self.conn.commit()
+            self.conn.execute('UPDATE games SET is_favorite = ? WHERE id = ?', (new_status, game_id))
             return bool(new_status)
         return False
 
+    @_writer
     def set_favorite(self, game_id: int, is_favorite: bool):
         """Set favorite status of a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE games SET is_favorite = ? WHERE id = ?', (1 if is_favorite else 0, game_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE games SET is_favorite = ? WHERE id = ?', (1 if is_favorite else 0, game_id))
 
+    @_writer
     def toggle_hidden(self, game_id: int) -> bool:
         """Toggle hidden status of a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT is_hidden FROM games WHERE id = ?', (game_id,))
-        result = cursor.fetchone()
+        result = self.conn.execute('SELECT is_hidden FROM games WHERE id = ?', (game_id,)).fetchone()
 
         if result:
             new_status = 0 if result['is_hidden'] else 1
-            cursor.execute('UPDATE games SET is_hidden = ? WHERE id = ?', (new_status, game_id))
-            self.conn.commit()
+            self.conn.execute('UPDATE games SET is_hidden = ? WHERE id = ?', (new_status, game_id))
             return bool(new_status)
         return False
 
+    @_writer
     def set_hidden(self, game_id: int, is_hidden: bool):
         """Set hidden status of a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE games SET is_hidden = ? WHERE id = ?', (1 if is_hidden else 0, game_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE games SET is_hidden = ? WHERE id = ?', (1 if is_hidden else 0, game_id))
 
     def get_favorites(self) -> List[Dict]:
         """Get all favorite games"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games WHERE is_favorite = 1 ORDER BY title')
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute('SELECT * FROM games WHERE is_favorite = 1 ORDER BY title')
+            return [self._row_to_dict(row) for row in cursor]
 
     def get_hidden_games(self) -> List[Dict]:
         """Get all hidden games"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM games WHERE is_hidden = 1 ORDER BY title')
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute('SELECT * FROM games WHERE is_hidden = 1 ORDER BY title')
+            return [self._row_to_dict(row) for row in cursor]
 
     # User ratings and notes
 
+    @_writer
     def set_rating(self, game_id: int, rating: int):
         """Set user rating for a game (1-5 stars)"""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE games SET user_rating = ? WHERE id = ?', (rating, game_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE games SET user_rating = ? WHERE id = ?', (rating, game_id))
 
+    @_writer
     def set_notes(self, game_id: int, notes: str):
         """Set user notes for a game"""
-        cursor = self.conn.cursor()
-        cursor.execute('UPDATE games SET user_notes = ? WHERE id = ?', (notes, game_id))
-        self.conn.commit()
+        self.conn.execute('UPDATE games SET user_notes = ? WHERE id = ?', (notes, game_id))
 
     # Recently played and sorting methods
 
     def get_recently_played(self, limit: int = 10) -> List[Dict]:
         """Get recently played games"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM games
-            WHERE last_played IS NOT NULL AND is_hidden = 0
-            ORDER BY last_played DESC
-            LIMIT ?
-        ''', (limit,))
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute('''
+                SELECT * FROM games
+                WHERE last_played IS NOT NULL AND is_hidden = 0
+                ORDER BY last_played DESC
+                LIMIT ?
+            ''', (limit,))
+            return [self._row_to_dict(row) for row in cursor]
 
     def get_most_played(self, limit: int = 10) -> List[Dict]:
         """Get most played games by total play time"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM games
-            WHERE total_play_time > 0 AND is_hidden = 0
-            ORDER BY total_play_time DESC
-            LIMIT ?
-        ''', (limit,))
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute('''
+                SELECT * FROM games
+                WHERE total_play_time > 0 AND is_hidden = 0
+                ORDER BY total_play_time DESC
+                LIMIT ?
+            ''', (limit,))
+            return [self._row_to_dict(row) for row in cursor]
 
     def get_recently_added(self, limit: int = 10) -> List[Dict]:
         """Get recently added games"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT * FROM games
-            WHERE is_hidden = 0
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (limit,))
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute('''
+                SELECT * FROM games
+                WHERE is_hidden = 0
+                ORDER BY created_at DESC
+                LIMIT ?
+            ''', (limit,))
+            return [self._row_to_dict(row) for row in cursor]
+
+    def get_home_lists(self, limit: int = 10) -> Dict[str, List[Dict]]:
+        """Get recently played, most played and recently added games in one query"""
+        lists = {'recently_played': [], 'most_played': [], 'recently_added': []}
+        with self._read_cursor() as cursor:
+            cursor.execute(_SQL_HOME_LISTS, (limit, limit, limit))
+            for row in cursor:
+                game = self._row_to_dict(row)
+                # Plain dict.pop so the lazy row is not expanded
+                lists[dict.pop(game, 'bucket')].append(game)
+        return lists
 
     # Duplicate detection
 
     def find_duplicates(self) -> List[Dict]:
         """Find duplicate games across platforms"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            SELECT title, COUNT(*) as count, GROUP_CONCAT(platform) as platforms, GROUP_CONCAT(id) as game_ids
-            FROM games
-            GROUP BY LOWER(TRIM(title))
-            HAVING count > 1
-            ORDER BY count DESC, title
-        ''')
-
-        rows = cursor.fetchall()
-        duplicates = []
-
-        for row in rows:
-            duplicates.append({
+        with self._read_cursor() as cursor:
+            cursor.execute(f'''
+                SELECT title, COUNT(*) as count,
+                       json_group_array(platform) as platforms,
+                       json_group_array(id) as game_ids
+                FROM games
+                GROUP BY {self.title_norm_expr}
+                HAVING count > 1
+                ORDER BY count DESC, title
+            ''')
+
+            return [{
                 'title': row['title'],
                 'count': row['count'],
-                'platforms': row['platforms'].split(',') if row['platforms'] else [],
-                'game_ids': [int(x) for x in row['game_ids'].split(',') if x]
-            })
-
-        return duplicates
+                'platforms': _loads(row['platforms']),
+                'game_ids': _loads(row['game_ids'])
+            } for row in cursor]
 
     # Advanced filtering
 
@@ -534,50 +1022,35 @@ class GameDatabase:
                       show_hidden: bool = False,
                       favorites_only: bool = False,
                       sort_by: str = 'title',
-                      sort_order: str = 'ASC') -> List[Dict]:
-        """Advanced game filtering"""
-        cursor = self.conn.cursor()
-
-        query = 'SELECT * FROM games WHERE 1=1'
+                      sort_order: str = 'ASC',
+                      raw: bool = False) -> List[Dict]:
+        """Advanced game filtering (sqlite3.Row objects if raw)"""
         params = []
-
-        if not show_hidden:
-            query += ' AND is_hidden = 0'
-
-        if favorites_only:
-            query += ' AND is_favorite = 1'
-
         if platform:
-            query += ' AND platform = ?'
             params.append(platform)
 
-        if search_query:
-            query += ' AND (title LIKE ? OR description LIKE ? OR developer LIKE ?)'
+        search_mode = None
+        match = _fts_query(search_query) if search_query and self.has_fts else ''
+        if match:
+            search_mode = 'fts'
+            params.append(match)
+        elif search_query:
+            search_mode = 'like'
             search_pattern = f'%{search_query}%'
             params.extend([search_pattern, search_pattern, search_pattern])
 
         if genre:
-            query += ' AND genres LIKE ?'
             params.append(f'%{genre}%')
 
-        # Add sorting - use whitelist mapping to prevent SQL injection
-        sort_fields_map = {
-            'title': 'title',
-            'last_played': 'last_played',
-            'total_play_time': 'total_play_time',
-            'launch_count': 'launch_count',
-            'created_at': 'created_at',
-            'release_date': 'release_date'
-        }
-        safe_sort_by = sort_fields_map.get(sort_by, 'title')
-        safe_sort_order = 'ASC' if sort_order.upper() == 'ASC' else 'DESC'
+        # Add sorting - use whitelist to prevent SQL injection
+        safe_sort_by = sort_by if sort_by in _VALID_SORT else 'title'
+        safe_sort_order = 'ASC' if str(sort_order).upper() == 'ASC' else 'DESC'
 
-        # Handle NULL values in sorting
-        if safe_sort_by in ['last_played', 'release_date']:
-            query += ' ORDER BY ' + safe_sort_by + ' IS NULL, ' + safe_sort_by + ' ' + safe_sort_order
-        else:
-            query += ' ORDER BY ' + safe_sort_by + ' ' + safe_sort_order
+        query = _filter_games_sql(bool(show_hidden), bool(favorites_only), bool(platform),
+                                  search_mode, bool(genre), safe_sort_by, safe_sort_order)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [self._row_to_dict(row) for row in rows]
+        with self._read_cursor() as cursor:
+            cursor.execute(query, params)
+            if raw:
+                return cursor.fetchall()
+            return [self._row_to_dict(row) for row in cursor]
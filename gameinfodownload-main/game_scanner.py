@@ -4,15 +4,34 @@ Searches for games from Steam, Epic Games Launcher, and Xbox Store
 """
 import json
 import os
+import shlex
+import subprocess
+import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from launchers import flush_console_logging, start_console_logging
 from launchers.steam_scanner import SteamScanner
 from launchers.epic_scanner import EpicScanner
 from launchers.xbox_scanner import XboxScanner
 from data.storage import GameDatabase
 
+__all__ = ['GameScanner']
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
 
 class GameScanner:
     """Main class to orchestrate game scanning from multiple platforms"""
@@ -25,13 +44,14 @@ class GameScanner:
             data_dir: Directory to store game data, icons, and box art
         """
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
 
-        # Create subdirectories for organized storage
+        # Create subdirectories for organized storage (data_dir comes with them);
+        # after the first run they exist, so this is just two stat calls
         self.icons_dir = self.data_dir / "icons"
         self.boxart_dir = self.data_dir / "boxart"
-        self.icons_dir.mkdir(exist_ok=True)
-        self.boxart_dir.mkdir(exist_ok=True)
+        if not (self.icons_dir.is_dir() and self.boxart_dir.is_dir()):
+            self.icons_dir.mkdir(parents=True, exist_ok=True)
+            self.boxart_dir.mkdir(parents=True, exist_ok=True)
 
         # Initialize database
         self.db = GameDatabase(str(self.data_dir / "games.db"))
@@ -43,10 +63,16 @@ class GameScanner:
             'xbox': XboxScanner(self.icons_dir, self.boxart_dir)
         }
 
-    def scan_all_games(self) -> Dict[str, List[Dict]]:
+    def scan_all_games(self, parallel: bool = False) -> Dict[str, List[Dict]]:
         """
         Scan all game launchers and collect game information
 
+        Args:
+            parallel: Run the launcher scanners concurrently. They are independent
+                filesystem/registry/network walks, so the scan takes about as long
+                as the slowest one. Off by default: the Electron app tracks progress
+                from the ordered "Scanning <PLATFORM> games..." lines.
+
         Returns:
             Dictionary with launcher names as keys and lists of game data as values
         """
@@ -55,21 +81,34 @@ class GameScanner:
         print("Starting game scan...")
         print("=" * 60)
 
+        futures = {}
+        if parallel:
+            print("\nScanning all platforms concurrently...")
+            executor = ThreadPoolExecutor(max_workers=len(self.scanners))
+            futures = {platform: executor.submit(scanner.scan_games)
+                       for platform, scanner in self.scanners.items()}
+            # Results are collected below in platform order
+            executor.shutdown(wait=False)
+
         for platform, scanner in self.scanners.items():
-            print(f"\nScanning {platform.upper()} games...")
+            if not parallel:
+                print(f"\nScanning {platform.upper()} games...")
             try:
-                games = scanner.scan_games()
+                games = futures[platform].result() if parallel else scanner.scan_games()
+                # Scanner log lines are written by a background thread; let them
+                # out before this platform's summary and the next "Scanning" line
+                flush_console_logging()
                 all_games[platform] = games
                 print(f"Found {len(games)} {platform.upper()} games")
 
                 # Save games to database in batch for better performance
                 if games:
                     print(f"Saving {len(games)} games to database...")
-                    for game in games:
-                        self.db.save_game(game)
+                    self.db.save_games(games)
                     print(f"Saved {len(games)} games successfully")
 
             except Exception as e:
+                flush_console_logging()
                 print(f"Error scanning {platform}: {e}")
                 all_games[platform] = []
 
@@ -79,21 +118,43 @@ class GameScanner:
 
         return all_games
 
-    def export_to_json(self, filename: str = "games_export.json"):
-        """Export all games to a JSON file"""
-        export_path = self.data_dir / filename
-        games = self.db.get_all_games()
+    def export_to_json(self, filename: str = "games_export.json", ndjson: bool = False):
+        """
+        Export all games to a JSON file
 
-        export_data = {
-            'export_date': datetime.now().isoformat(),
-            'total_games': len(games),
-            'games': games
-        }
+        Games are streamed from the database and written one at a time, so
+        memory use does not grow with library size.
 
-        with open(export_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        Args:
+            filename: Output file name inside the data directory
+            ndjson: Write one game object per line instead of a JSON document
+        """
+        export_path = self.data_dir / filename
+        # Written beside the target and swapped in at the end, so readers such as
+        # the server's /api/games never see a half-written export
+        tmp_path = export_path.with_name(export_path.name + '.tmp')
+        total = 0
 
-        print(f"\nExported {len(games)} games to {export_path}")
+        try:
+            with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+                if ndjson:
+                    for game in self.db.iter_games():
+                        f.write(_dumps(game.expand_metadata()) + b'\n')
+                        total += 1
+                else:
+                    f.write(b'{"export_date": ' + _dumps(datetime.now().isoformat()) + b', "games": [')
+                    for game in self.db.iter_games():
+                        f.write(b',\n' if total else b'\n')
+                        f.write(_dumps(game.expand_metadata()))
+                        total += 1
+                    # Counted while streaming, so it always matches the games written
+                    f.write(b'\n], "total_games": ' + str(total).encode() + b'}\n')
+            os.replace(tmp_path, export_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        print(f"\nExported {total} games to {export_path}")
         return export_path
 
     def get_game_by_title(self, title: str) -> Dict:
@@ -106,9 +167,6 @@ class GameScanner:
 
     def launch_game(self, game_id: int):
         """Launch a game by its database ID"""
-        import subprocess
-        import shlex
-
         game = self.db.get_game_by_id(game_id)
         if not game:
             print(f"Game with ID {game_id} not found")
@@ -124,15 +182,13 @@ class GameScanner:
             # Use subprocess instead of os.system to avoid command injection
             # For URL protocols (steam://, epic://, etc.), use webbrowser module
             if launch_cmd.startswith(('steam://', 'epic://', 'com.epicgames.launcher://', 'xbox://', 'http://', 'https://')):
-                import webbrowser
                 webbrowser.open(launch_cmd)
             else:
                 # For executable paths, use subprocess with shell=False for safety
                 # Always use list format to avoid command injection
                 if os.name == 'nt':  # Windows
                     # Use os.startfile for Windows executables (safer than subprocess)
-                    import os as os_module
-                    os_module.startfile(launch_cmd)
+                    os.startfile(launch_cmd)
                 else:  # Unix-like systems
                     # Use shlex.split to properly parse command with arguments
                     subprocess.Popen(shlex.split(launch_cmd), shell=False)
@@ -144,6 +200,7 @@ def main():
     """Main entry point for the application"""
     # Check for custom data directory from environment variable (for Electron)
     data_dir = os.getenv('GAME_DATA_DIR', 'game_data')
+    start_console_logging()
     scanner = GameScanner(data_dir=data_dir)
 
     print("=" * 60)
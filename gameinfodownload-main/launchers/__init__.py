@@ -1 +1,49 @@
 """Game launcher scanner modules"""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# Scanner progress goes through the "launchers" logger. Importing the package
+# configures nothing; entry points (game_scanner, cli, server) call
+# start_console_logging() to print it to stdout, which main.js reads.
+_log_listener: Optional[QueueListener] = None
+
+
+def start_console_logging(queued: bool = True) -> None:
+    """
+    Print scanner log records to stdout, unformatted
+
+    Args:
+        queued: Hand records to a listener thread, so scan worker threads never
+            block on console output. Call flush_console_logging() before
+            printing to stdout directly, so lines keep their order. Worker
+            processes pass False and write records straight away.
+    """
+    global _log_listener
+    logger = logging.getLogger(__name__)
+    if logger.handlers:
+        return
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    if not queued:
+        logger.addHandler(logging.StreamHandler(sys.stdout))
+        return
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def flush_console_logging() -> None:
+    """Write out every record queued so far; returns once they are on stdout"""
+    if _log_listener is not None:
+        # stop() handles everything ahead of its sentinel before returning;
+        # records queued meanwhile wait for the restarted thread
+        _log_listener.stop()
+        _log_listener.start()
@@ -0,0 +1,101 @@
+"""
+Download helpers
+Shared by the launcher scanners for saving artwork from CDNs
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response bodies are copied to disk in chunks of this size
+CHUNK_SIZE = 64 * 1024
+
+
+def save_response(response, save_path: Path, chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Stream a response body (requested with stream=True) to a file
+
+    The body is written to a temporary .part file next to save_path and moved
+    into place once complete, so memory use stays at one chunk and an
+    interrupted download never leaves a truncated image behind.
+
+    Args:
+        response: requests.Response opened with stream=True
+        save_path: Final location of the file
+        chunk_size: Bytes read from the socket per write
+    """
+    part_path = save_path.with_name(save_path.name + '.part')
+    try:
+        with open(part_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+        os.replace(part_path, save_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+def revalidation_headers(entry: Optional[Dict], url: str, save_path: Path) -> Optional[Dict[str, str]]:
+    """
+    Conditional request headers for refreshing an earlier download
+
+    Args:
+        entry: Asset cache record for save_path (see asset_cache_entry), or None
+        url: URL about to be fetched
+        save_path: Local copy of the asset
+
+    Returns:
+        None if there is no usable local copy of url and it must be fetched in
+        full; otherwise the If-None-Match / If-Modified-Since headers to send.
+        An empty dict means the server gave no validators and the local copy is
+        reused as is.
+    """
+    if not entry or entry.get('url') != url:
+        return None
+    try:
+        if save_path.stat().st_size == 0:
+            return None
+    except OSError:
+        return None
+
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def asset_cache_entry(url: str, response) -> Dict:
+    """Asset cache record for a completed download: its URL and validators"""
+    return {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }
+
+
+def load_asset_cache(path: Path) -> Dict:
+    """Load a JSON cache file, starting empty if it is missing or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        cache = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_asset_cache(path: Path, cache: Dict) -> None:
+    """Write a JSON cache file via a temporary file so it is never truncated"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+    else:
+        tmp_path.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+    os.replace(tmp_path, path)
@@ -2,24 +2,157 @@
 Epic Games Launcher Scanner
 Detects and extracts information about installed Epic Games
 """
+import hashlib
 import json
+import logging
 import os
-import re
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import platform
 
+from . import start_console_logging
+from .downloads import (asset_cache_entry, load_asset_cache, revalidation_headers,
+                        save_asset_cache, save_response)
+from .text import clean_description, safe_filename
+
 try:
     from .icon_extractor import extract_game_icon
     ICON_EXTRACTOR_AVAILABLE = True
 except ImportError:
     ICON_EXTRACTOR_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Host OS name ('Windows', 'Linux', 'Darwin'); it can't change while we run
+_SYSTEM = platform.system()
+_PROGRAMDATA = Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData'))
+
+logger = logging.getLogger(__name__)
+
+
+# Epic Games GraphQL API endpoint and catalog query
+_GRAPHQL_URL = "https://graphql.epicgames.com/graphql"
+# Fields requested for each catalog offer
+_CATALOG_OFFER_FIELDS = """
+            title
+            description
+            longDescription
+            keyImages {
+                type
+                url
+            }
+            seller {
+                name
+            }
+            developer
+            publisherDisplayName
+            releaseDate
+            tags {
+                name
+            }
+"""
+_GRAPHQL_QUERY = """
+query catalogQuery($namespace: String!, $itemId: String!) {
+    Catalog {
+        catalogOffer(namespace: $namespace, id: $itemId) {%s        }
+    }
+}
+""" % _CATALOG_OFFER_FIELDS
+
+# Content-Type is set by json=
+_GRAPHQL_HEADERS = {
+    "Accept-Language": "en-US,en;q=0.9"
+}
+_PERSISTED_QUERY_ERRORS = frozenset({
+    'PersistedQueryNotFound', 'PersistedQueryNotSupported',
+    'PERSISTED_QUERY_NOT_FOUND', 'PERSISTED_QUERY_NOT_SUPPORTED',
+})
+
+
+def _persisted_query_error(data) -> Optional[str]:
+    """Return the persisted-query error in a GraphQL response, if any"""
+    if not isinstance(data, dict):
+        return None
+    for error in data.get('errors') or []:
+        if not isinstance(error, dict):
+            continue
+        code = (error.get('extensions') or {}).get('code')
+        for value in (error.get('message'), code):
+            if value in _PERSISTED_QUERY_ERRORS:
+                return value
+    return None
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def _query_hash(query: str) -> str:
+    """Apollo persisted-query ID: the server looks the document up by this hash"""
+    return hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _batch_catalog_query(count: int) -> str:
+    """
+    Build a catalog query that looks up `count` offers in one request
+
+    Each offer is an aliased Catalog field (g0, g1, ...) taking its namespace
+    and id from the variables ns0/id0, ns1/id1, ...
+    """
+    params = ', '.join(f"$ns{i}: String!, $id{i}: String!" for i in range(count))
+    fields = ''.join(
+        f"    g{i}: Catalog {{\n        catalogOffer(namespace: $ns{i}, id: $id{i}) {{"
+        f"{_CATALOG_OFFER_FIELDS}        }}\n    }}\n"
+        for i in range(count)
+    )
+    return f"\nquery catalogBatchQuery({params}) {{\n{fields}}}\n"
+
+
+def _load_json_file(path: Path):
+    """Read and parse a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
 
 class EpicScanner:
     """Scanner for Epic Games Launcher games"""
 
+    # Concurrent metadata/image requests during a scan
+    MAX_WORKERS = 16
+    # Simultaneous artwork downloads, kept below MAX_WORKERS to stay clear of CDN rate limits
+    MAX_CDN_DOWNLOADS = 8
+    # Image downloads are streamed to disk in chunks of this size
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+    # Refuse CDN responses that claim to be larger than this
+    MAX_IMAGE_BYTES = 50 * 1024 * 1024
+    # URL and HTTP validators of each downloaded image, stored next to icons/ and boxart/
+    ASSET_CACHE_FILE = 'epic_asset_cache.json'
+    # Catalog metadata by namespace:item ID with its fetch time, reused until it expires
+    METADATA_CACHE_FILE = 'epic_metadata_cache.json'
+    METADATA_CACHE_TTL = int(os.environ.get('EPIC_METADATA_TTL', 24 * 60 * 60))
+    # Catalog offers looked up per GraphQL request; small enough to stay under query cost limits
+    METADATA_BATCH_SIZE = 10
+
     # Metadata enrichment for popular games
     GAME_METADATA_ENRICHMENT = {
         'Fortnite': {
@@ -47,12 +180,15 @@ class EpicScanner:
             'short_description': 'Massively multiplayer party game with obstacle courses'
         }
     }
+    # (lowercased title, title, enrichment), lowercased once at class creation
+    _ENRICH_INDEX = tuple((known_game.lower(), known_game, enrichment)
+                          for known_game, enrichment in GAME_METADATA_ENRICHMENT.items())
 
     # Common Epic Games Launcher paths by platform
     EPIC_PATHS = {
         'Windows': [
-            Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / 'Epic' / 'EpicGamesLauncher' / 'Data' / 'Manifests',
-            Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / 'Epic' / 'UnrealEngineLauncher' / 'LauncherInstalled.dat'
+            _PROGRAMDATA / 'Epic' / 'EpicGamesLauncher' / 'Data' / 'Manifests',
+            _PROGRAMDATA / 'Epic' / 'UnrealEngineLauncher' / 'LauncherInstalled.dat'
         ],
         'Linux': [
             Path.home() / '.config' / 'Epic' / 'EpicGamesLauncher' / 'Data' / 'Manifests'
@@ -73,10 +209,75 @@ class EpicScanner:
         self.icons_dir = icons_dir
         self.boxart_dir = boxart_dir
         self.manifests_path = self._find_manifests_directory()
+        self.session = self._create_session()
+        self.graphql_client = self._create_graphql_client()
+        self._cdn_slots = threading.BoundedSemaphore(self.MAX_CDN_DOWNLOADS)
+        self.asset_cache_path = self.icons_dir.parent / self.ASSET_CACHE_FILE
+        self._asset_cache = load_asset_cache(self.asset_cache_path)
+        self._asset_cache_lock = threading.Lock()
+        # Editions/DLC can share a catalog item, and repeat scans reuse fresh entries
+        self.metadata_cache_path = self.icons_dir.parent / self.METADATA_CACHE_FILE
+        self._metadata_cache = load_asset_cache(self.metadata_cache_path)
+        self._metadata_cache_lock = threading.Lock()
+        # Cleared once the GraphQL server shows it can't resolve persisted queries.
+        # It only ever goes from True to False, so threads racing on it cost at
+        # most one extra hash-only request each
+        self._persisted_queries = True
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the HTTP session shared by all Epic API and CDN requests"""
+        session = requests.Session()
+        # Keep-alive pool so every game reuses the same TLS connections
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # Gateway errors are transient; the catalog POST is a read, so it is safe to repeat
+                status_forcelist=(502, 503, 504),
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {'POST'},
+                raise_on_status=False
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _create_graphql_client(self):
+        """
+        Client for the catalog GraphQL endpoint: an HTTP/2 httpx client when
+        httpx[http2] is installed (concurrent queries share one multiplexed
+        connection), otherwise the shared requests session
+        """
+        if httpx is not None:
+            try:
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+                )
+                return httpx.Client(transport=transport, timeout=10.0)
+            except ImportError:
+                # httpx without the h2 package
+                pass
+        return self.session
+
+    def _save_caches(self):
+        """Persist the image download and catalog metadata caches"""
+        for path, cache, lock in ((self.asset_cache_path, self._asset_cache, self._asset_cache_lock),
+                                  (self.metadata_cache_path, self._metadata_cache, self._metadata_cache_lock)):
+            with lock:
+                data = dict(cache)
+            try:
+                save_asset_cache(path, data)
+            except OSError as e:
+                logger.error("Error saving %s: %s", path.name, e)
 
     def _get_registry_manifest_path(self) -> Optional[Path]:
         """Try to find manifest path from Windows Registry"""
-        if platform.system() != 'Windows':
+        if _SYSTEM != 'Windows':
             return None
 
         try:
@@ -95,7 +296,7 @@ class EpicScanner:
                         if app_data_path:
                             manifest_path = Path(app_data_path) / 'Manifests'
                             if manifest_path.exists() and manifest_path.is_dir():
-                                print(f"  Found manifests path from Registry: {manifest_path}")
+                                logger.info("  Found manifests path from Registry: %s", manifest_path)
                                 return manifest_path
                 except OSError:
                     continue
@@ -103,13 +304,13 @@ class EpicScanner:
         except ImportError:
             pass
         except Exception as e:
-            print(f"Error accessing Registry: {e}")
+            logger.error("Error accessing Registry: %s", e)
 
         return None
 
     def _find_manifests_directory(self) -> Optional[Path]:
         """Find Epic Games manifests directory"""
-        system = platform.system()
+        system = _SYSTEM
 
         # First check Registry on Windows
         if system == 'Windows':
@@ -135,12 +336,12 @@ class EpicScanner:
         Args:
             game_info: Dictionary containing game information (modified in-place)
         """
-        title = game_info.get('title', '')
+        title = game_info.get('title', '').lower()
 
         # Check if this is a known game that needs metadata enrichment
-        for known_game, enrichment in self.GAME_METADATA_ENRICHMENT.items():
-            if known_game.lower() in title.lower():
-                print(f"  [OK] Enriching metadata for {known_game}")
+        for known_lower, known_game, enrichment in self._ENRICH_INDEX:
+            if known_lower in title:
+                logger.info("  [OK] Enriching metadata for %s", known_game)
                 # Only add fields if they don't already exist or are empty
                 for key, value in enrichment.items():
                     if not game_info.get(key):
@@ -150,25 +351,22 @@ class EpicScanner:
     def _parse_manifest(self, manifest_path: Path) -> Optional[Dict]:
         """Parse an Epic Games manifest file"""
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return data
+            return _load_json_file(manifest_path)
         except Exception as e:
-            print(f"Error parsing {manifest_path}: {e}")
+            logger.error("Error parsing %s: %s", manifest_path, e)
             return None
 
     def _get_launcher_installed_data(self) -> List[Dict]:
         """Get installed games from LauncherInstalled.dat (alternative method)"""
-        system = platform.system()
+        system = _SYSTEM
         games = []
 
         if system == 'Windows':
-            launcher_data_path = Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / 'Epic' / 'UnrealEngineLauncher' / 'LauncherInstalled.dat'
+            launcher_data_path = _PROGRAMDATA / 'Epic' / 'UnrealEngineLauncher' / 'LauncherInstalled.dat'
 
             if launcher_data_path.exists():
                 try:
-                    with open(launcher_data_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _load_json_file(launcher_data_path)
 
                     installations = data.get('InstallationList', [])
                     for install in installations:
@@ -176,138 +374,221 @@ class EpicScanner:
                             games.append(install)
 
                 except Exception as e:
-                    print(f"Error reading LauncherInstalled.dat: {e}")
+                    logger.error("Error reading LauncherInstalled.dat: %s", e)
 
         return games
 
     def _download_epic_image(self, image_url: str, app_name: str, image_type: str) -> Optional[str]:
-        """Download image from Epic Games CDN"""
+        """Download image from Epic Games CDN, skipping it if the cached copy is current"""
         if not image_url:
             return None
 
+        # Sanitize filename
+        safe_name = safe_filename(app_name)
+
+        if image_type == 'icon':
+            filename = f"epic_{safe_name}_icon.jpg"
+            save_path = self.icons_dir / filename
+            relative_path = f"game_data/icons/{filename}"
+        else:
+            filename = f"epic_{safe_name}_boxart.jpg"
+            save_path = self.boxart_dir / filename
+            relative_path = f"game_data/boxart/{filename}"
+
+        # Revalidate a previous download of the same URL instead of fetching it again
+        with self._asset_cache_lock:
+            cached = self._asset_cache.get(relative_path)
+        headers = revalidation_headers(cached, image_url, save_path)
+        if headers == {}:
+            return relative_path
+
         try:
-            response = requests.get(image_url, timeout=10)
-            if response.status_code == 200:
-                # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', '_', app_name)
+            with self._cdn_slots, self.session.get(image_url, headers=headers, stream=True, timeout=10) as response:
+                if response.status_code == 304:
+                    return relative_path
+                if response.status_code != 200:
+                    return None
 
-                if image_type == 'icon':
-                    filename = f"epic_{safe_name}_icon.jpg"
-                    save_path = self.icons_dir / filename
-                    relative_path = f"game_data/icons/{filename}"
-                else:
-                    filename = f"epic_{safe_name}_boxart.jpg"
-                    save_path = self.boxart_dir / filename
-                    relative_path = f"game_data/boxart/{filename}"
+                content_length = int(response.headers.get('Content-Length') or 0)
+                if content_length > self.MAX_IMAGE_BYTES:
+                    logger.warning("Skipping %s for %s: %s bytes is too large", image_type, app_name, content_length)
+                    return None
 
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
+                save_response(response, save_path, self.DOWNLOAD_CHUNK_SIZE)
+
+                with self._asset_cache_lock:
+                    self._asset_cache[relative_path] = asset_cache_entry(image_url, response)
 
                 # Return relative path for URL construction
                 return relative_path
 
         except Exception as e:
-            print(f"Error downloading {image_type} for {app_name}: {e}")
+            logger.error("Error downloading %s for %s: %s", image_type, app_name, e)
 
         return None
 
-    def _get_epic_metadata(self, namespace: str, catalog_item_id: str, app_name: str) -> Dict:
-        """Fetch metadata from Epic Games API"""
-        metadata = {
-            'description': '',
-            'long_description': '',
-            'developer': '',
-            'publisher': '',
-            'release_date': '',
-            'genres': [],
-            'icon_url': '',
-            'boxart_url': ''
+    def _query_catalog(self, operation_name: str, query: str, variables: Dict) -> Optional[Dict]:
+        """
+        Run a catalog query and return the parsed response (None on HTTP error).
+        The query is first sent as an Apollo persisted query (hash only); if the
+        server doesn't know the hash, the full document is sent, which registers it.
+        Each batch size is its own document, so each gets its own hash.
+        """
+        payload = {
+            "operationName": operation_name,
+            "variables": variables,
+            "extensions": {"persistedQuery": {"version": 1, "sha256Hash": _query_hash(query)}}
         }
 
-        try:
-            # Epic Games GraphQL API endpoint
-            url = "https://graphql.epicgames.com/graphql"
-
-            query = """
-            query catalogQuery($namespace: String!, $itemId: String!) {
-                Catalog {
-                    catalogOffer(namespace: $namespace, id: $itemId) {
-                        title
-                        description
-                        longDescription
-                        keyImages {
-                            type
-                            url
-                        }
-                        seller {
-                            name
-                        }
-                        developer
-                        publisherDisplayName
-                        releaseDate
-                        tags {
-                            name
-                        }
-                    }
+        hash_not_found = False
+        if self._persisted_queries:
+            response = self.graphql_client.post(_GRAPHQL_URL, json=payload, headers=_GRAPHQL_HEADERS, timeout=10)
+            if response.status_code == 200:
+                data = _loads(response.content)
+                error = _persisted_query_error(data)
+                if error is None:
+                    return data
+                hash_not_found = error in ('PersistedQueryNotFound', 'PERSISTED_QUERY_NOT_FOUND')
+
+        response = self.graphql_client.post(
+            _GRAPHQL_URL,
+            json={**payload, "query": query},
+            headers=_GRAPHQL_HEADERS,
+            timeout=10
+        )
+        if response.status_code != 200:
+            return None
+
+        if self._persisted_queries and not hash_not_found:
+            # The full document works but the hash didn't: the server has no persisted query support
+            self._persisted_queries = False
+        # Parse the raw body directly rather than through response.json()'s text decode
+        return _loads(response.content)
+
+    def _get_cached_metadata(self, key: str) -> Optional[Dict]:
+        """Return a copy of the cached metadata for "namespace:id" if younger than METADATA_CACHE_TTL"""
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(key)
+        if cached and time.time() - cached.get('fetched_at', 0) < self.METADATA_CACHE_TTL:
+            metadata = cached['metadata']
+            return {**metadata, 'genres': list(metadata.get('genres', []))}
+        return None
+
+    def _cache_metadata(self, key: str, metadata: Dict) -> None:
+        """Remember fetched metadata; failed lookups come back empty and stay uncached so a later scan retries"""
+        if any(metadata.values()):
+            with self._metadata_cache_lock:
+                self._metadata_cache[key] = {
+                    'metadata': {**metadata, 'genres': list(metadata['genres'])},
+                    'fetched_at': time.time()
                 }
-            }
-            """
 
+    def _get_epic_metadata_batch(self, items: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Fetch metadata for several (namespace, catalog_item_id) pairs
+
+        Cached entries are reused; the rest are looked up with one aliased
+        GraphQL request. If the server rejects the batch, each item falls back
+        to its own request.
+
+        Returns:
+            Metadata for each pair, in order
+        """
+        results = [self._get_cached_metadata(f"{ns}:{item_id}") for ns, item_id in items]
+        missing = [i for i, metadata in enumerate(results) if metadata is None]
+        if not missing:
+            return results
+
+        fetched = self._fetch_epic_metadata_batch([items[i] for i in missing]) if len(missing) > 1 else None
+        if fetched is None:
+            fetched = [self._fetch_epic_metadata(*items[i]) for i in missing]
+
+        for i, metadata in zip(missing, fetched):
+            self._cache_metadata("%s:%s" % items[i], metadata)
+            results[i] = metadata
+        return results
+
+    def _fetch_epic_metadata_batch(self, items: List[Tuple[str, str]]) -> Optional[List[Dict]]:
+        """Query the Epic Games catalog for several items in one request (None if the batch failed)"""
+        variables = {}
+        for i, (namespace, catalog_item_id) in enumerate(items):
+            variables[f"ns{i}"] = namespace
+            variables[f"id{i}"] = catalog_item_id
+
+        try:
+            response = self._query_catalog("catalogBatchQuery", _batch_catalog_query(len(items)), variables)
+            if response is None:
+                return None
+            data = response.get('data')
+        except Exception as e:
+            logger.error("Error fetching Epic metadata batch: %s", e)
+            return None
+
+        # Query cost limits and similar rejections come back without data
+        if not isinstance(data, dict):
+            return None
+        return [self._parse_catalog_offer((data.get(f"g{i}") or {}).get('catalogOffer'))
+                for i in range(len(items))]
+
+    def _fetch_epic_metadata(self, namespace: str, catalog_item_id: str) -> Dict:
+        """Query the Epic Games catalog for one item"""
+        offer = None
+        try:
             variables = {
                 "namespace": namespace,
                 "itemId": catalog_item_id
             }
 
-            headers = {
-                "Content-Type": "application/json",
-                "Accept-Language": "en-US,en;q=0.9"
-            }
-
-            response = requests.post(
-                url,
-                json={"query": query, "variables": variables},
-                headers=headers,
-                timeout=10
-            )
+            data = self._query_catalog("catalogQuery", _GRAPHQL_QUERY, variables)
 
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 offer = data.get('data', {}).get('Catalog', {}).get('catalogOffer', {})
 
-                if offer:
-                    # Prefer shorter description, clean HTML tags
-                    desc = offer.get('description', '') or offer.get('longDescription', '')
-                    # Remove HTML tags
-                    desc = re.sub(r'<[^>]+>', '', desc)
-                    # Clean up extra whitespace
-                    desc = ' '.join(desc.split())
-                    # Limit to 300 characters for cleaner display
-                    if len(desc) > 300:
-                        desc = desc[:297] + '...'
-
-                    metadata['description'] = desc
-                    metadata['long_description'] = offer.get('longDescription', '')
-                    metadata['developer'] = offer.get('developer', '')
-                    metadata['publisher'] = offer.get('publisherDisplayName', '')
-                    metadata['release_date'] = offer.get('releaseDate', '')
-
-                    # Extract genres from tags
-                    tags = offer.get('tags', [])
-                    metadata['genres'] = [tag.get('name', '') for tag in tags if tag.get('name')]
-
-                    # Extract images
-                    key_images = offer.get('keyImages', [])
-                    for image in key_images:
-                        img_type = image.get('type', '')
-                        img_url = image.get('url', '')
-
-                        if img_type == 'DieselGameBoxTall' or img_type == 'DieselGameBox':
-                            metadata['boxart_url'] = img_url
-                        elif img_type == 'DieselGameBoxLogo' or img_type == 'Thumbnail':
-                            metadata['icon_url'] = img_url
-
         except Exception as e:
-            print(f"Error fetching Epic metadata: {e}")
+            logger.error("Error fetching Epic metadata: %s", e)
+
+        return self._parse_catalog_offer(offer)
+
+    @staticmethod
+    def _parse_catalog_offer(offer: Optional[Dict]) -> Dict:
+        """Convert a catalogOffer from the GraphQL API into game metadata (empty fields if missing)"""
+        metadata = {
+            'description': '',
+            'long_description': '',
+            'developer': '',
+            'publisher': '',
+            'release_date': '',
+            'genres': [],
+            'icon_url': '',
+            'boxart_url': ''
+        }
+
+        if offer:
+            # Prefer shorter description, clean HTML tags
+            desc = offer.get('description', '') or offer.get('longDescription', '')
+            # Strip HTML tags and whitespace runs, limit to 300 characters
+            desc = clean_description(desc)
+
+            metadata['description'] = desc
+            metadata['long_description'] = offer.get('longDescription', '')
+            metadata['developer'] = offer.get('developer', '')
+            metadata['publisher'] = offer.get('publisherDisplayName', '')
+            metadata['release_date'] = offer.get('releaseDate', '')
+
+            # Extract genres from tags
+            tags = offer.get('tags', [])
+            metadata['genres'] = [tag.get('name', '') for tag in tags if tag.get('name')]
+
+            # Extract images
+            key_images = offer.get('keyImages', [])
+            for image in key_images:
+                img_type = image.get('type', '')
+                img_url = image.get('url', '')
+
+                if img_type == 'DieselGameBoxTall' or img_type == 'DieselGameBox':
+                    metadata['boxart_url'] = img_url
+                elif img_type == 'DieselGameBoxLogo' or img_type == 'Thumbnail':
+                    metadata['icon_url'] = img_url
 
         return metadata
 
@@ -321,7 +602,7 @@ class EpicScanner:
         # Common Fortnite installation paths
         possible_paths = []
 
-        if platform.system() == 'Windows':
+        if _SYSTEM == 'Windows':
             # Check all drive letters
             import string
             available_drives = ['%s:' % d for d in string.ascii_uppercase if os.path.exists('%s:' % d)]
@@ -335,7 +616,7 @@ class EpicScanner:
                     f"{drive}\\Fortnite"
                 ])
 
-        print("  Searching for Fortnite manually...")
+        logger.info("  Searching for Fortnite manually...")
 
         for install_path in possible_paths:
             if not os.path.exists(install_path):
@@ -349,7 +630,7 @@ class EpicScanner:
 
             for exe_path in exe_paths:
                 if os.path.exists(exe_path):
-                    print(f"  [OK] Found Fortnite at: {install_path}")
+                    logger.info("  [OK] Found Fortnite at: %s", install_path)
 
                     game_info = {
                         'platform': 'epic',
@@ -369,7 +650,7 @@ class EpicScanner:
 
                     # Try to extract icon from executable
                     if ICON_EXTRACTOR_AVAILABLE:
-                        print(f"  Extracting icon from Fortnite executable...")
+                        logger.info("  Extracting icon from Fortnite executable...")
                         exe_icon_filename = f"epic_Fortnite_exe.png"
                         exe_icon_file_path = self.icons_dir / exe_icon_filename
 
@@ -381,7 +662,7 @@ class EpicScanner:
                             game_info['icon_path'] = exe_icon_path_value
                             game_info['boxart_path'] = exe_icon_path_value
                             game_info['header_path'] = exe_icon_path_value
-                            print(f"  [OK] Extracted icon from Fortnite executable")
+                            logger.info("  [OK] Extracted icon from Fortnite executable")
 
                     # Enrich with known metadata
                     self._enrich_game_metadata(game_info)
@@ -390,6 +671,35 @@ class EpicScanner:
 
         return None
 
+    def _extract_exe_icons(self, targets: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        Extract executable icons for (install_dir, display_name) pairs
+
+        Extraction (GDI drawing plus resize and PNG encode) is CPU-bound, so on
+        Windows the pairs are spread across worker processes; pywin32 device
+        contexts can't be shared between threads.
+
+        Returns:
+            Relative icon path for each pair, or None where extraction failed
+        """
+        filenames = [f"epic_{safe_filename(name)}_exe.png" for _, name in targets]
+        install_dirs = [install_dir for install_dir, _ in targets]
+        names = [name for _, name in targets]
+        output_paths = [str(self.icons_dir / filename) for filename in filenames]
+
+        if _SYSTEM == 'Windows' and len(targets) > 1:
+            # Workers print their progress too if this process does
+            console = bool(logging.getLogger('launchers').handlers)
+            with ProcessPoolExecutor(max_workers=min(len(targets), os.cpu_count() or 1),
+                                     initializer=start_console_logging if console else None,
+                                     initargs=(False,)) as pool:
+                results = list(pool.map(extract_game_icon, install_dirs, names, output_paths))
+        else:
+            results = list(map(extract_game_icon, install_dirs, names, output_paths))
+
+        return [f"game_data/icons/{filename}" if extracted else None
+                for filename, extracted in zip(filenames, results)]
+
     def scan_games(self) -> List[Dict]:
         """
         Scan for installed Epic Games
@@ -401,111 +711,136 @@ class EpicScanner:
 
         # Method 1: Scan manifest files
         if self.manifests_path:
-            print(f"  Found Epic Games manifests directory: {self.manifests_path}")
-            manifest_files = list(self.manifests_path.glob('*.item'))
-            print(f"  Found {len(manifest_files)} manifest files")
-
-            for manifest_file in manifest_files:
-                manifest = self._parse_manifest(manifest_file)
+            logger.info("  Found Epic Games manifests directory: %s", self.manifests_path)
+            # One directory read; DirEntry carries the file type, so no extra stat per entry
+            try:
+                with os.scandir(self.manifests_path) as it:
+                    manifest_files = [
+                        Path(entry.path) for entry in it
+                        if entry.name.endswith('.item') and entry.is_file(follow_symlinks=False)
+                    ]
+            except OSError as e:
+                logger.error("Error reading manifests directory: %s", e)
+                manifest_files = []
+            logger.info("  Found %s manifest files", len(manifest_files))
+
+            # Each game's pipeline (manifest read -> metadata request -> artwork downloads)
+            # is I/O-bound, so stages overlap on one pool: a metadata request is queued
+            # as soon as its manifest is parsed. Games are assembled below in manifest order.
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                entries = []
+                catalog_items = []
+                for manifest in executor.map(self._parse_manifest, manifest_files):
+                    if not manifest:
+                        continue
+
+                    app_name = manifest.get('AppName', '')
+                    display_name = manifest.get('DisplayName', '')
+                    install_location = manifest.get('InstallLocation', '')
+                    catalog_namespace = manifest.get('CatalogNamespace', '')
+                    catalog_item_id = manifest.get('CatalogItemId', '')
+                    launch_executable = manifest.get('LaunchExecutable', '')
+
+                    if not app_name:
+                        continue
 
-                if not manifest:
-                    continue
-
-                app_name = manifest.get('AppName', '')
-                display_name = manifest.get('DisplayName', '')
-                install_location = manifest.get('InstallLocation', '')
-                catalog_namespace = manifest.get('CatalogNamespace', '')
-                catalog_item_id = manifest.get('CatalogItemId', '')
-                launch_executable = manifest.get('LaunchExecutable', '')
-
-                if not app_name:
-                    continue
-
-                game_info = {
-                    'platform': 'epic',
-                    'app_name': app_name,
-                    'title': display_name or app_name,
-                    'install_directory': install_location,
-                    'launch_command': f"com.epicgames.launcher://apps/{app_name}?action=launch&silent=true",
-                    'launch_executable': launch_executable,
-                    'namespace': catalog_namespace,
-                    'catalog_item_id': catalog_item_id,
-                    'has_vr_support': 0  # Epic doesn't provide VR metadata in their API
-                }
-
-                # Get metadata
-                print(f"  Fetching metadata for: {display_name}")
-                if catalog_namespace and catalog_item_id:
-                    metadata = self._get_epic_metadata(catalog_namespace, catalog_item_id, app_name)
+                    game_info = {
+                        'platform': 'epic',
+                        'app_name': app_name,
+                        'title': display_name or app_name,
+                        'install_directory': install_location,
+                        'launch_command': f"com.epicgames.launcher://apps/{app_name}?action=launch&silent=true",
+                        'launch_executable': launch_executable,
+                        'namespace': catalog_namespace,
+                        'catalog_item_id': catalog_item_id,
+                        'has_vr_support': 0  # Epic doesn't provide VR metadata in their API
+                    }
+                    entries.append(game_info)
+
+                    logger.info("  Fetching metadata for: %s", game_info['title'])
+                    if catalog_namespace and catalog_item_id:
+                        catalog_items.append((catalog_namespace, catalog_item_id))
+                    else:
+                        catalog_items.append(None)
+
+                # Catalog lookups go out as aliased GraphQL batches, run concurrently
+                lookups = list(dict.fromkeys(item for item in catalog_items if item))
+                batches = [lookups[i:i + self.METADATA_BATCH_SIZE]
+                           for i in range(0, len(lookups), self.METADATA_BATCH_SIZE)]
+                batch_futures = [executor.submit(self._get_epic_metadata_batch, batch) for batch in batches]
+
+                # Extract executable icons in one batch while the metadata requests are in flight
+                exe_icons = [None] * len(entries)
+                if ICON_EXTRACTOR_AVAILABLE:
+                    indices = [i for i, game_info in enumerate(entries)
+                               if game_info['install_directory'] and os.path.exists(game_info['install_directory'])]
+                    for i in indices:
+                        logger.info("  Extracting icon from executable for: %s", entries[i]['title'])
+                    extracted = self._extract_exe_icons(
+                        [(entries[i]['install_directory'], entries[i]['title']) for i in indices])
+                    for i, exe_icon_path_value in zip(indices, extracted):
+                        exe_icons[i] = exe_icon_path_value
+
+                metadata_by_item = {}
+                for batch, future in zip(batches, batch_futures):
+                    metadata_by_item.update(zip(batch, future.result()))
+
+                image_futures = []
+                for game_info, item in zip(entries, catalog_items):
+                    if item is None:
+                        image_futures.append(None)
+                        continue
+
+                    metadata = metadata_by_item[item]
                     game_info.update(metadata)
 
                     # Download images
-                    print(f"  Downloading assets for: {display_name}")
-                    icon_path = None
-                    boxart_path = None
-                    header_path = None
-
+                    display_name = game_info['title']
+                    logger.info("  Downloading assets for: %s", display_name)
+                    icon_future = boxart_future = None
                     if metadata.get('icon_url'):
-                        icon_path = self._download_epic_image(metadata['icon_url'], display_name, 'icon')
-
+                        icon_future = executor.submit(
+                            self._download_epic_image, metadata['icon_url'], display_name, 'icon')
                     if metadata.get('boxart_url'):
-                        boxart_path = self._download_epic_image(metadata['boxart_url'], display_name, 'boxart')
+                        boxart_future = executor.submit(
+                            self._download_epic_image, metadata['boxart_url'], display_name, 'boxart')
+                    image_futures.append((icon_future, boxart_future))
+
+                for game_info, images, exe_icon_path_value in zip(entries, image_futures, exe_icons):
+                    if exe_icon_path_value:
+                        logger.info("  [OK] Extracted icon from game executable: %s", game_info['title'])
+
+                    if images is not None:
+                        icon_future, boxart_future = images
+                        icon_path = icon_future.result() if icon_future else None
+                        boxart_path = boxart_future.result() if boxart_future else None
                         # For Epic, use the same image for both boxart and header (Epic doesn't provide multiple formats)
                         header_path = boxart_path
 
-                    # Always extract executable icon for thumbnails (if available)
-                    exe_icon_path_value = None
-                    if ICON_EXTRACTOR_AVAILABLE:
-                        if install_location and os.path.exists(install_location):
-                            print(f"  Extracting icon from executable for: {display_name}")
-                            safe_name = re.sub(r'[<>:"/\\|?*]', '_', display_name)
-                            exe_icon_filename = f"epic_{safe_name}_exe.png"
-                            exe_icon_file_path = self.icons_dir / exe_icon_filename
-
-                            extracted_path = extract_game_icon(install_location, display_name, str(exe_icon_file_path))
-                            if extracted_path:
-                                exe_icon_path_value = f"game_data/icons/{exe_icon_filename}"
-                                print(f"  [OK] Extracted icon from game executable")
-
-                    game_info['icon_path'] = icon_path
-                    game_info['boxart_path'] = boxart_path
-                    game_info['header_path'] = header_path
-                    game_info['exe_icon_path'] = exe_icon_path_value
-                else:
-                    game_info['icon_path'] = None
-                    game_info['boxart_path'] = None
-                    game_info['header_path'] = None
-
-                    # Try Windows icon extraction even if metadata not available
-                    exe_icon_path_value = None
-                    if ICON_EXTRACTOR_AVAILABLE and install_location and os.path.exists(install_location):
-                        print(f"  Extracting icon from executable for: {display_name}")
-                        safe_name = re.sub(r'[<>:"/\\|?*]', '_', display_name)
-                        exe_icon_filename = f"epic_{safe_name}_exe.png"
-                        exe_icon_file_path = self.icons_dir / exe_icon_filename
-
-                        extracted_path = extract_game_icon(install_location, display_name, str(exe_icon_file_path))
-                        if extracted_path:
-                            exe_icon_path_value = f"game_data/icons/{exe_icon_filename}"
-                            # Use exe icon as fallback for icon_path and boxart_path if no metadata
-                            game_info['icon_path'] = exe_icon_path_value
-                            game_info['boxart_path'] = exe_icon_path_value
-                            game_info['header_path'] = exe_icon_path_value
-                            print(f"  [OK] Extracted icon from game executable")
+                        game_info['icon_path'] = icon_path
+                        game_info['boxart_path'] = boxart_path
+                        game_info['header_path'] = header_path
+                    else:
+                        # Use exe icon as fallback for icon_path and boxart_path if no metadata
+                        game_info['icon_path'] = exe_icon_path_value
+                        game_info['boxart_path'] = exe_icon_path_value
+                        game_info['header_path'] = exe_icon_path_value
 
                     game_info['exe_icon_path'] = exe_icon_path_value
 
-                # Enrich metadata for well-known games
-                self._enrich_game_metadata(game_info)
+                    # Enrich metadata for well-known games
+                    self._enrich_game_metadata(game_info)
 
-                games.append(game_info)
+                    games.append(game_info)
+
+            self._save_caches()
 
         # Method 2: Fallback to LauncherInstalled.dat
         if not games:
             if not self.manifests_path:
-                print("  Epic Games manifests directory not found. Trying LauncherInstalled.dat...")
+                logger.info("  Epic Games manifests directory not found. Trying LauncherInstalled.dat...")
             else:
-                print("  No games found in manifests. Trying LauncherInstalled.dat...")
+                logger.info("  No games found in manifests. Trying LauncherInstalled.dat...")
             installed_data = self._get_launcher_installed_data()
             for install in installed_data:
                 app_name = install.get('AppName', '')
@@ -528,8 +863,8 @@ class EpicScanner:
 
                 # Try Windows icon extraction
                 if ICON_EXTRACTOR_AVAILABLE and install_dir and os.path.exists(install_dir):
-                    print(f"  Extracting icon from executable for: {display_name or app_name}")
-                    safe_name = re.sub(r'[<>:"/\\|?*]', '_', display_name or app_name)
+                    logger.info("  Extracting icon from executable for: %s", display_name or app_name)
+                    safe_name = safe_filename(display_name or app_name)
                     exe_icon_filename = f"epic_{safe_name}_exe.png"
                     exe_icon_path = self.icons_dir / exe_icon_filename
 
@@ -537,7 +872,7 @@ class EpicScanner:
                     if extracted_path:
                         game_info['icon_path'] = f"game_data/icons/{exe_icon_filename}"
                         game_info['boxart_path'] = game_info['icon_path']
-                        print(f"  [OK] Extracted icon from game executable")
+                        logger.info("  [OK] Extracted icon from game executable")
 
                 # Enrich metadata for well-known games
                 self._enrich_game_metadata(game_info)
@@ -547,10 +882,10 @@ class EpicScanner:
         # Method 3: Manual Fortnite detection (if not already found)
         fortnite_found = any(game.get('title', '').lower() == 'fortnite' for game in games)
         if not fortnite_found:
-            print("  Fortnite not found in manifests, searching manually...")
+            logger.info("  Fortnite not found in manifests, searching manually...")
             fortnite_game = self._find_fortnite_manually()
             if fortnite_game:
                 games.append(fortnite_game)
-                print(f"  [OK] Successfully added Fortnite to game list")
+                logger.info("  [OK] Successfully added Fortnite to game list")
 
         return games
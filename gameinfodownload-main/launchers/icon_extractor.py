@@ -1,19 +1,80 @@
 """
 Windows Icon Extractor
-Extracts icons from Windows executables using Win32 API
+Extracts icons from Windows executables from their PE resources or via the Win32 API
 """
+import json
+import logging
 import os
+import re
+import struct
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from PIL import Image
 import io
 
+try:
+    import pefile
+except ImportError:
+    pefile = None
+
+try:
+    import win32api
+    import win32con
+    import win32gui
+    import win32ui
+except ImportError:
+    # pywin32 is only available on Windows; its drawing fallback is skipped without it
+    win32api = win32con = win32gui = win32ui = None
+
+logger = logging.getLogger(__name__)
+
+# Icon images stored PNG-compressed (256x256 ones, usually) start with this
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Executables to exclude (not the main game)
+_EXCLUDE_NAMES = [
+    'unins', 'uninstall', 'setup', 'launcher', 'updater', 'update',
+    'crashreporter', 'crash', 'support', 'config', 'settings',
+    'redist', 'install', 'activation', 'easyanticheat', 'battleye',
+    'uplay', 'origin', 'epicgameslauncher', 'steam', 'ubisoft',
+    'dx', 'vcredist', 'physx', 'redistributable', 'dotnet',
+    'directx', '_be', '_eac'  # Anti-cheat
+]
+
+# Common non-game directories skipped by the recursive search
+_SKIP_DIRS = ['_commonredist', 'redist', '__installer', 'support', 'docs', 'manual']
+
+# Substring tests against the lowercased name, done in one pass by the re engine
+_EXCLUDE_RE = re.compile('|'.join(map(re.escape, _EXCLUDE_NAMES)))
+_SKIP_DIR_RE = re.compile('|'.join(map(re.escape, _SKIP_DIRS)))
+
+# Threads used to list directories during the recursive executable search
+_WALK_WORKERS = 8
+# An executable this large is taken to be the main game; the recursive search
+# stops descending once it has found one
+_MAIN_EXE_MIN_SIZE = 50 * 1024 * 1024
+
+# Icons saved by this process, keyed by (exe path, exe mtime, icon size), so a
+# repeated request for an unchanged executable skips the PE/GDI work entirely
+_extracted_icons: Dict[Tuple[str, int, int], str] = {}
+
+# GDI objects icons are drawn into, created once and reused by every
+# _draw_icon_gdi call: (screen DC, memory DC, bitmap, (width, height))
+_gdi_canvas = None
+_gdi_lock = threading.Lock()
+
 
 def extract_icon_from_exe(exe_path: str, output_path: str, size: int = 256) -> Optional[str]:
     """
     Extract icon from Windows executable and save as image
 
+    The icon is read from the executable's resources with pefile, which works
+    on any OS; on Windows, pywin32 drawing is the fallback when that fails.
+
     Args:
         exe_path: Path to the executable file
         output_path: Path to save the extracted icon
@@ -22,55 +83,175 @@ def extract_icon_from_exe(exe_path: str, output_path: str, size: int = 256) -> O
     Returns:
         Path to the saved icon, or None if extraction failed
     """
-    if sys.platform != 'win32':
+    try:
+        key = (os.path.normcase(exe_path), os.stat(exe_path).st_mtime_ns, size)
+    except OSError:
         return None
 
-    if not os.path.exists(exe_path):
-        return None
+    cached = _extracted_icons.get(key)
+    if cached == output_path and os.path.exists(output_path):
+        return output_path
 
     try:
-        import win32api
-        import win32con
-        import win32ui
-        import win32gui
+        img = _read_pe_icon(exe_path)
+        if img is None and sys.platform == 'win32':
+            img = _draw_icon_gdi(exe_path)
+        if img is None:
+            return None
 
-        # Extract icon handle from exe
-        ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
-        ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
+        # Resize if needed. System icons (32x32/48x48) are upscaled, where
+        # bicubic looks the same as Lanczos at a fraction of the cost; for
+        # downscales, reducing_gap lets Pillow box-reduce before the Lanczos pass
+        ico_x, ico_y = img.size
+        if size != ico_x or size != ico_y:
+            if size >= max(ico_x, ico_y):
+                img = img.resize((size, size), Image.Resampling.BICUBIC)
+            else:
+                img = img.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=2.0)
 
-        # Try to extract large icon first
-        large, small = win32gui.ExtractIconEx(exe_path, 0)
+        # Save as PNG; fast zlib level, since icons are small and encoded once per scan
+        img.save(output_path, 'PNG', compress_level=1)
 
-        if not large and not small:
-            return None
+        _extracted_icons[key] = output_path
+        return output_path
 
-        # Prefer large icon, fallback to small
-        hicon = large[0] if large else small[0]
+    except Exception as e:
+        logger.error("Error extracting icon from %s: %s", exe_path, e)
+        return None
+
+
+def _read_pe_icon(exe_path: str) -> Optional[Image.Image]:
+    """
+    Read the largest image of the executable's main icon from its PE resources
+
+    Returns:
+        RGBA image, or None if pefile is unavailable or the file has no icon
+    """
+    if pefile is None:
+        return None
+
+    # Any malformed header, resource table or image data means "no icon here",
+    # so the caller can fall back to drawing it with the Win32 API
+    try:
+        pe = pefile.PE(exe_path, fast_load=True)
+        try:
+            pe.parse_data_directories(directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE']])
+            resources = getattr(pe, 'DIRECTORY_ENTRY_RESOURCE', None)
+            if resources is None:
+                return None
+
+            # RT_ICON images by resource id, and the first RT_GROUP_ICON (the main icon)
+            icons = {}
+            group = None
+            for entry in resources.entries:
+                if entry.id == pefile.RESOURCE_TYPE['RT_ICON']:
+                    for icon in entry.directory.entries:
+                        if icon.directory.entries:
+                            icons[icon.id] = icon.directory.entries[0].data.struct
+                elif entry.id == pefile.RESOURCE_TYPE['RT_GROUP_ICON'] and group is None:
+                    if entry.directory.entries and entry.directory.entries[0].directory.entries:
+                        data = entry.directory.entries[0].directory.entries[0].data.struct
+                        group = pe.get_data(data.OffsetToData, data.Size)
+            if group is None or len(group) < 6:
+                return None
+
+            # GRPICONDIR: 6-byte header, then 14-byte entries of
+            # (width, height, colors, reserved, planes, bit count, bytes, icon id).
+            # A width/height of 0 means 256.
+            count = struct.unpack_from('<H', group, 4)[0]
+            best = None
+            for i in range(count):
+                if 6 + 14 * (i + 1) > len(group):
+                    break
+                width, height, colors, _, planes, bit_count, _, icon_id = struct.unpack_from('<BBBBHHIH', group, 6 + 14 * i)
+                rank = (width or 256, bit_count)
+                if icon_id in icons and (best is None or rank > best[0]):
+                    best = (rank, icon_id, width, height, colors, planes, bit_count)
+            if best is None:
+                return None
+
+            _, icon_id, width, height, colors, planes, bit_count = best
+            data = icons[icon_id]
+            image_data = pe.get_data(data.OffsetToData, data.Size)
+        finally:
+            pe.close()
+
+        if not image_data.startswith(_PNG_SIGNATURE):
+            # Resource images are bare DIBs; prefix a one-image ICO header so Pillow can read them
+            image_data = struct.pack('<HHHBBBBHHII', 0, 1, 1, width, height, colors, 0,
+                                     planes, bit_count, len(image_data), 22) + image_data
+
+        img = Image.open(io.BytesIO(image_data))
+        img.load()
+        return img.convert('RGBA')
+    except (pefile.PEFormatError, struct.error, OSError, ValueError, IndexError, AttributeError,
+            Image.DecompressionBombError):
+        return None
+
+
+def _get_gdi_canvas(width: int, height: int):
+    """
+    Return the shared memory DC and bitmap, (re)creating them for a new size
+
+    Must be called with _gdi_lock held.
+    """
+    global _gdi_canvas
+    if _gdi_canvas is not None and _gdi_canvas[3] == (width, height):
+        return _gdi_canvas[1], _gdi_canvas[2]
 
-        # Create a device context
+    if _gdi_canvas is None:
         hdc = win32ui.CreateDCFromHandle(win32gui.GetDC(0))
-        hbmp = win32ui.CreateBitmap()
-        hbmp.CreateCompatibleBitmap(hdc, ico_x, ico_y)
-        hdc_bitmap = hdc.CreateCompatibleDC()
+    else:
+        hdc, old_memdc, old_bmp, _ = _gdi_canvas
+        _gdi_canvas = None
+        old_memdc.DeleteDC()
+        win32gui.DeleteObject(old_bmp.GetHandle())
+
+    hbmp = win32ui.CreateBitmap()
+    hbmp.CreateCompatibleBitmap(hdc, width, height)
+    hdc_bitmap = hdc.CreateCompatibleDC()
+    hdc_bitmap.SelectObject(hbmp)
+    _gdi_canvas = (hdc, hdc_bitmap, hbmp, (width, height))
+    return hdc_bitmap, hbmp
+
+
+def _draw_icon_gdi(exe_path: str) -> Optional[Image.Image]:
+    """Draw the executable's icon with the Win32 API (requires pywin32)"""
+    if win32gui is None:
+        return None
+
+    # Extract icon handle from exe
+    ico_x = win32api.GetSystemMetrics(win32con.SM_CXICON)
+    ico_y = win32api.GetSystemMetrics(win32con.SM_CYICON)
 
-        hdc_bitmap.SelectObject(hbmp)
-        hdc_bitmap.DrawIcon((0, 0), hicon)
+    # Try to extract large icon first
+    large, small = win32gui.ExtractIconEx(exe_path, 0)
 
-        # Convert to PIL Image
-        bmpstr = hbmp.GetBitmapBits(True)
-        img = Image.frombuffer(
+    if not large and not small:
+        return None
+
+    try:
+        # Prefer large icon, fallback to small
+        hicon = large[0] if large else small[0]
+
+        # Draw into the shared bitmap, cleared first since it still holds the
+        # previous icon; GetBitmapBits returns a copy, so the lock can be
+        # released before the image is built
+        with _gdi_lock:
+            hdc_bitmap, hbmp = _get_gdi_canvas(ico_x, ico_y)
+            hdc_bitmap.FillSolidRect((0, 0, ico_x, ico_y), 0)
+            hdc_bitmap.DrawIcon((0, 0), hicon)
+            bmpstr = hbmp.GetBitmapBits(True)
+
+        # Convert to PIL Image. Pillow's C raw unpacker swizzles BGRX -> RGB in
+        # one pass; a numpy gather + fromarray measured ~10x slower for 256x256
+        return Image.frombuffer(
             'RGB',
             (ico_x, ico_y),
             bmpstr, 'raw', 'BGRX', 0, 1
         )
 
-        # Resize if needed
-        if size != ico_x or size != ico_y:
-            img = img.resize((size, size), Image.Resampling.LANCZOS)
-
-        # Save as PNG
-        img.save(output_path, 'PNG')
-
+    finally:
         # Cleanup - Destroy all icon handles (ExtractIconEx returns copies)
         # Don't try to destroy the same handle twice
         try:
@@ -79,24 +260,44 @@ def extract_icon_from_exe(exe_path: str, output_path: str, size: int = 256) -> O
                     try:
                         win32gui.DestroyIcon(icon)
                     except Exception as e:
-                        print(f"Warning: Failed to destroy large icon handle: {e}")
+                        logger.warning("Warning: Failed to destroy large icon handle: %s", e)
             if small:
                 for icon in small:
                     try:
                         win32gui.DestroyIcon(icon)
                     except Exception as e:
-                        print(f"Warning: Failed to destroy small icon handle: {e}")
+                        logger.warning("Warning: Failed to destroy small icon handle: %s", e)
         except Exception as e:
-            print(f"Warning: Icon cleanup failed (image already saved): {e}")
+            logger.warning("Warning: Icon cleanup failed: %s", e)
 
-        return output_path
 
-    except ImportError:
-        # pywin32 not installed
-        return None
-    except Exception as e:
-        print(f"Error extracting icon from {exe_path}: {e}")
-        return None
+def _scan_directory(path: str) -> Tuple[List[os.DirEntry], List[str]]:
+    """
+    List one directory for the executable search
+
+    Returns:
+        Tuple of (candidate .exe entries, subdirectories to descend into)
+    """
+    exes = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    name = entry.name.lower()
+                    if entry.is_file():
+                        # Skip excluded names
+                        if name.endswith('.exe') and not _EXCLUDE_RE.search(name[:-4]):
+                            exes.append(entry)
+                    elif entry.is_dir():
+                        # Skip some common non-game directories
+                        if not _SKIP_DIR_RE.search(name):
+                            subdirs.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass  # Skip directories we can't access
+    return exes, subdirs
 
 
 def find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
@@ -104,6 +305,9 @@ def find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
     Find the main game executable in the installation directory
     Uses comprehensive search patterns to find executables in various directory structures
 
+    Results are memoized per resolved directory and its modification time, so
+    repeat lookups for the same game skip the directory walk.
+
     Args:
         install_dir: Game installation directory
         game_name: Name of the game
@@ -111,26 +315,42 @@ def find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
     Returns:
         Path to the main executable, or None if not found
     """
+    try:
+        real_dir = os.path.realpath(install_dir)
+        mtime_ns = os.stat(real_dir).st_mtime_ns
+    except OSError:
+        return _find_game_executable(install_dir, game_name)
+    return _find_game_executable_cached(real_dir, mtime_ns, game_name)
+
+
+@lru_cache(maxsize=512)
+def _find_game_executable_cached(install_dir: str, mtime_ns: int, game_name: str) -> Optional[str]:
+    """find_game_executable keyed on the directory's mtime (part of the key only)"""
+    return _find_game_executable(install_dir, game_name)
+
+
+def _find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
+    """Uncached executable search behind find_game_executable"""
     if not os.path.exists(install_dir):
-        print(f"[ICON_EXTRACT] Install directory does not exist: {install_dir}")
+        logger.info("[ICON_EXTRACT] Install directory does not exist: %s", install_dir)
         return None
 
     # Skip soundtracks and DLC that don't have executables
     soundtrack_keywords = ['soundtrack', 'ost', 'original sound', 'music', 'score']
     if any(keyword in game_name.lower() for keyword in soundtrack_keywords):
-        print(f"[ICON_EXTRACT] Skipping soundtrack/music: {game_name}")
+        logger.info("[ICON_EXTRACT] Skipping soundtrack/music: %s", game_name)
         return None
 
     # Skip common redistributables and middleware
     skip_keywords = ['redistributables', 'common redistributables', 'steamvr', 'vcredist',
                      'directx', 'dotnet', '_commonredist']
     if any(keyword in game_name.lower() for keyword in skip_keywords):
-        print(f"[ICON_EXTRACT] Skipping redistributable: {game_name}")
+        logger.info("[ICON_EXTRACT] Skipping redistributable: %s", game_name)
         return None
 
     install_path = Path(install_dir)
-    print(f"[ICON_EXTRACT] Searching for executable in: {install_dir}")
-    print(f"[ICON_EXTRACT] Game name: {game_name}")
+    logger.info("[ICON_EXTRACT] Searching for executable in: %s", install_dir)
+    logger.info("[ICON_EXTRACT] Game name: %s", game_name)
 
     # Generate common executable name patterns
     patterns = [
@@ -144,13 +364,30 @@ def find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
         f"{''.join(word[0] for word in game_name.split())}.exe",  # Acronym
     ]
 
+    # List the root directory once; the pattern, subdirectory and root .exe
+    # checks below are lookups in this listing (case-insensitive, as on Windows)
+    root_files = {}
+    root_dirs = {}
+    try:
+        with os.scandir(install_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        root_files[entry.name.lower()] = entry
+                    elif entry.is_dir():
+                        root_dirs[entry.name.lower()] = entry
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
     # Try exact matches first in root directory
-    print(f"[ICON_EXTRACT] Trying exact pattern matches in root...")
+    logger.info("[ICON_EXTRACT] Trying exact pattern matches in root...")
     for pattern in patterns:
-        exe_path = install_path / pattern
-        if exe_path.exists():
-            print(f"[ICON_EXTRACT] [OK] Found exe via pattern match: {exe_path.name}")
-            return str(exe_path)
+        entry = root_files.get(pattern.lower())
+        if entry is not None:
+            logger.info("[ICON_EXTRACT] [OK] Found exe via pattern match: %s", entry.name)
+            return entry.path
 
     # Common subdirectories where games store executables (in priority order)
     common_subdirs = [
@@ -164,86 +401,110 @@ def find_game_executable(install_dir: str, game_name: str) -> Optional[str]:
         'data', 'game', 'content'
     ]
 
-    # Executables to exclude (not the main game)
-    exclude_names = [
-        'unins', 'uninstall', 'setup', 'launcher', 'updater', 'update',
-        'crashreporter', 'crash', 'support', 'config', 'settings',
-        'redist', 'install', 'activation', 'easyanticheat', 'battleye',
-        'uplay', 'origin', 'epicgameslauncher', 'steam', 'ubisoft',
-        'dx', 'vcredist', 'physx', 'redistributable', 'dotnet',
-        'directx', '_be', '_eac'  # Anti-cheat
-    ]
-
     # First, try looking in common subdirectories
-    print(f"[ICON_EXTRACT] Searching in common subdirectories...")
+    logger.info("[ICON_EXTRACT] Searching in common subdirectories...")
     for subdir in common_subdirs:
         subdir_path = install_path / subdir
-        if subdir_path.exists() and subdir_path.is_dir():
-            print(f"[ICON_EXTRACT]   Checking: {subdir}")
-            exe_files = list(subdir_path.glob("*.exe"))
-            exe_files = [
-                exe for exe in exe_files
-                if not any(exclude in exe.stem.lower() for exclude in exclude_names)
-            ]
+        if subdir.split('/', 1)[0].lower() in root_dirs and subdir_path.is_dir():
+            logger.info("[ICON_EXTRACT]   Checking: %s", subdir)
+            exe_files, _ = _scan_directory(str(subdir_path))
 
             if exe_files:
                 # Prefer the largest exe (usually the main game)
-                exe_files.sort(key=lambda x: x.stat().st_size, reverse=True)
-                print(f"[ICON_EXTRACT] [OK] Found exe in {subdir}: {exe_files[0].name}")
-                return str(exe_files[0])
+                best = max(exe_files, key=lambda entry: entry.stat().st_size)
+                logger.info("[ICON_EXTRACT] [OK] Found exe in %s: %s", subdir, best.name)
+                return best.path
 
     # Look for any .exe in root directory (if we haven't checked yet)
-    print(f"[ICON_EXTRACT] Searching root directory for any exe...")
-    exe_files = list(install_path.glob("*.exe"))
+    logger.info("[ICON_EXTRACT] Searching root directory for any exe...")
     exe_files = [
-        exe for exe in exe_files
-        if not any(exclude in exe.stem.lower() for exclude in exclude_names)
+        entry for name, entry in root_files.items()
+        if name.endswith('.exe') and not _EXCLUDE_RE.search(name[:-4])
     ]
 
     if exe_files:
         # Prefer the largest exe
-        exe_files.sort(key=lambda x: x.stat().st_size, reverse=True)
-        print(f"[ICON_EXTRACT] [OK] Found exe in root: {exe_files[0].name}")
-        return str(exe_files[0])
+        best = max(exe_files, key=lambda entry: entry.stat().st_size)
+        logger.info("[ICON_EXTRACT] [OK] Found exe in root: %s", best.name)
+        return best.path
 
     # Last resort: recursive search (max depth 3 to avoid going too deep)
-    print(f"[ICON_EXTRACT] Performing recursive search (depth 3)...")
-    all_exes = []
+    logger.info("[ICON_EXTRACT] Performing recursive search (depth 3)...")
+    best = None
+    best_size = -1
+    max_depth = 3
+
+    # Walk one depth level at a time, listing that level's directories in
+    # parallel; directory reads are latency-bound, so they overlap well.
+    # Track the largest executable (usually the main game) as we go and stop
+    # descending once it is clearly a full game binary. The root has no
+    # candidates left by now, so the walk starts from its subdirectories.
+    level = [entry.path for name, entry in root_dirs.items() if not _SKIP_DIR_RE.search(name)]
+    with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as executor:
+        for _ in range(max_depth):
+            if not level:
+                break
+            next_level = []
+            for exes, subdirs in executor.map(_scan_directory, level):
+                for entry in exes:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size > best_size:
+                        best, best_size = entry, size
+                next_level.extend(subdirs)
+            if best_size >= _MAIN_EXE_MIN_SIZE:
+                break
+            level = next_level
+
+    if best is not None:
+        logger.info("[ICON_EXTRACT] [OK] Found exe via recursive search: %s", best.path)
+        return best.path
+
+    logger.info("[ICON_EXTRACT] [NOT FOUND] No executable found for: %s", game_name)
+    return None
 
-    def search_recursive(path: Path, depth: int = 0, max_depth: int = 3):
-        if depth > max_depth:
-            return
 
-        try:
-            for item in path.iterdir():
-                if item.is_file() and item.suffix.lower() == '.exe':
-                    # Skip excluded names
-                    if not any(exclude in item.stem.lower() for exclude in exclude_names):
-                        all_exes.append(item)
-                elif item.is_dir():
-                    # Skip some common non-game directories
-                    skip_dirs = ['_commonredist', 'redist', '__installer', 'support', 'docs', 'manual']
-                    if not any(skip in item.name.lower() for skip in skip_dirs):
-                        search_recursive(item, depth + 1, max_depth)
-        except (PermissionError, OSError):
-            pass  # Skip directories we can't access
-
-    search_recursive(install_path)
-
-    if all_exes:
-        # Prefer the largest executable (usually the main game)
-        all_exes.sort(key=lambda x: x.stat().st_size, reverse=True)
-        print(f"[ICON_EXTRACT] [OK] Found exe via recursive search: {all_exes[0]}")
-        return str(all_exes[0])
-
-    print(f"[ICON_EXTRACT] [NOT FOUND] No executable found for: {game_name}")
-    return None
+def _icon_source_path(output_path: str) -> str:
+    """Sidecar file recording which executable an extracted icon came from"""
+    return output_path + '.source.json'
+
+
+def _exe_signature(exe_path: str) -> Dict:
+    """Identity of an executable's current contents: path, mtime and size"""
+    st = os.stat(exe_path)
+    return {'exe': exe_path, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size}
+
+
+def _cached_game_icon(install_dir: str, output_path: str) -> bool:
+    """
+    Whether an icon saved by an earlier scan can be reused
+
+    It must be non-empty, newer than the install directory (no executable was
+    added or removed at the top level), and its source executable must still
+    have the mtime and size recorded when it was extracted, so an update that
+    replaces e.g. Binaries/Win64/Game.exe is picked up.
+    """
+    try:
+        icon_stat = os.stat(output_path)
+        if icon_stat.st_size == 0 or icon_stat.st_mtime < os.stat(install_dir).st_mtime:
+            return False
+        with open(_icon_source_path(output_path), 'rb') as f:
+            source = json.loads(f.read())
+        return isinstance(source, dict) and _exe_signature(source['exe']) == source
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
 
 
 def extract_game_icon(install_dir: str, game_name: str, output_path: str) -> Optional[str]:
     """
     Find and extract icon from game executable
 
+    An icon saved by an earlier scan is reused while its source executable is
+    unchanged (see _cached_game_icon), so rescans skip the executable search
+    and extraction.
+
     Args:
         install_dir: Game installation directory
         game_name: Name of the game
@@ -252,9 +513,19 @@ def extract_game_icon(install_dir: str, game_name: str, output_path: str) -> Opt
     Returns:
         Path to the saved icon, or None if extraction failed
     """
+    if _cached_game_icon(install_dir, output_path):
+        return output_path
+
     exe_path = find_game_executable(install_dir, game_name)
 
     if not exe_path:
         return None
 
-    return extract_icon_from_exe(exe_path, output_path)
+    result = extract_icon_from_exe(exe_path, output_path)
+    if result:
+        try:
+            with open(_icon_source_path(output_path), 'w', encoding='utf-8') as f:
+                json.dump(_exe_signature(exe_path), f)
+        except OSError as e:
+            logger.warning("Could not record icon source for %s: %s", output_path, e)
+    return result
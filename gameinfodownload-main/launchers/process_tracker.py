@@ -3,17 +3,46 @@ Windows Process Tracker for Accurate Playtime Monitoring
 Uses psutil to track if game processes are actually running
 """
 
+import os
 import psutil
+import threading
 import time
 import json
 from pathlib import Path
-from typing import Optional, Dict
+from typing import AbstractSet, Optional, Dict, Tuple
 from datetime import datetime
 
+# Only POSIX has zombie processes; on Windows the status() call is skipped
+_CHECK_ZOMBIES = not psutil.WINDOWS
+
+
+def _read_proc_stat(pid: int) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Read a process's state and start time (in clock ticks) from /proc (Linux)
+
+    One read answers both "is it a zombie" and "is it still the process we
+    started tracking", which is is_running() plus status() in psutil.
+
+    Returns:
+        (state, start ticks) as bytes, or None if the process is gone
+    """
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    # The command name in parentheses may contain spaces; fields follow the last ')'
+    fields = data.rpartition(b')')[2].split()
+    return fields[0], fields[19]
+
 
 class ProcessTracker:
     def __init__(self):
         self.tracked_processes = {}  # {session_id: {process_info}}
+        # Guards changes to tracked_processes and reads that walk it; psutil
+        # calls are made outside it so a slow process query never blocks
+        # the service's command and monitor threads on each other
+        self._lock = threading.RLock()
 
     def find_process_by_path(self, exe_path: str) -> Optional[psutil.Process]:
         """
@@ -25,18 +54,19 @@ class ProcessTracker:
         Returns:
             Process object if found, None otherwise
         """
+        if not exe_path:
+            return None
+
         try:
-            exe_path_normalized = Path(exe_path).resolve()
+            # Compare normalized path strings; resolving every process's exe
+            # would stat the filesystem once per running process. process_iter
+            # reads the requested attributes under oneshot()
+            exe_path_normalized = os.path.normcase(os.path.abspath(exe_path))
 
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'create_time']):
-                try:
-                    proc_exe = proc.info.get('exe')
-                    if proc_exe:
-                        proc_exe_normalized = Path(proc_exe).resolve()
-                        if proc_exe_normalized == exe_path_normalized:
-                            return proc
-                except (psutil.NoSuchProcess, psutil.AccessDenied, OSError):
-                    continue
+            for proc in psutil.process_iter(['exe']):
+                proc_exe = proc.info.get('exe')
+                if proc_exe and os.path.normcase(os.path.normpath(proc_exe)) == exe_path_normalized:
+                    return proc
 
         except Exception as e:
             print(f"[PROCESS_TRACKER] Error finding process: {e}")
@@ -54,12 +84,13 @@ class ProcessTracker:
             Process object if found, None otherwise
         """
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'create_time']):
-                try:
-                    if proc.info['name'].lower() == process_name.lower():
-                        return proc
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            process_name = process_name.lower()
+            # process_iter fetches the requested attributes under oneshot(); only
+            # the name is compared (the PID and create_time are always known)
+            for proc in psutil.process_iter(['name']):
+                name = proc.info['name']
+                if name and name.lower() == process_name:
+                    return proc
         except Exception as e:
             print(f"[PROCESS_TRACKER] Error finding process by name: {e}")
 
@@ -86,7 +117,8 @@ class ProcessTracker:
 
         return None
 
-    def start_tracking(self, session_id: int, exe_path: str, game_name: str) -> bool:
+    def start_tracking(self, session_id: int, exe_path: str, game_name: str,
+                       pid: Optional[int] = None) -> bool:
         """
         Start tracking a process for playtime
 
@@ -94,13 +126,24 @@ class ProcessTracker:
             session_id: Database session ID
             exe_path: Path to game executable
             game_name: Name of the game
+            pid: Process ID of the game, when the caller launched it directly;
+                the process table is only searched without one
 
         Returns:
             True if tracking started, False otherwise
         """
         try:
+            process = None
+            if pid is not None:
+                try:
+                    process = psutil.Process(pid)
+                except (psutil.Error, TypeError, ValueError):
+                    # Gone, inaccessible, or not a valid PID: search for it instead
+                    process = None
+
             # Find the process
-            process = self.find_process_by_path(exe_path)
+            if not process:
+                process = self.find_process_by_path(exe_path)
 
             if not process:
                 # Try by game name
@@ -111,7 +154,7 @@ class ProcessTracker:
                 print(f"[PROCESS_TRACKER] Could not find process for {game_name}")
                 return False
 
-            self.tracked_processes[session_id] = {
+            info = {
                 'process': process,
                 'game_name': game_name,
                 'exe_path': exe_path,
@@ -119,6 +162,12 @@ class ProcessTracker:
                 'pid': process.pid,
                 'create_time': process.create_time()
             }
+            if psutil.LINUX:
+                # Identity recorded in /proc's own units for is_process_running
+                stat = _read_proc_stat(process.pid)
+                info['start_ticks'] = stat[1] if stat else None
+            with self._lock:
+                self.tracked_processes[session_id] = info
 
             print(f"[PROCESS_TRACKER] Started tracking {game_name} (PID: {process.pid})")
             return True
@@ -127,22 +176,38 @@ class ProcessTracker:
             print(f"[PROCESS_TRACKER] Error starting tracking: {e}")
             return False
 
-    def is_process_running(self, session_id: int) -> bool:
+    def is_process_running(self, session_id: int, live_pids: Optional[AbstractSet[int]] = None) -> bool:
         """
         Check if a tracked process is still running
 
         Args:
             session_id: Database session ID
+            live_pids: Snapshot of psutil.pids() taken by the caller when checking
+                many sessions; PIDs missing from it are reported ended without
+                querying the process
 
         Returns:
             True if running, False otherwise
         """
-        if session_id not in self.tracked_processes:
+        info = self.tracked_processes.get(session_id)
+        if info is None:
             return False
+        if live_pids is not None and info['pid'] not in live_pids:
+            return False
+
+        start_ticks = info.get('start_ticks')
+        if start_ticks is not None:
+            # Same checks as below from a single /proc read: a different start
+            # time means the PID was reused
+            stat = _read_proc_stat(info['pid'])
+            return stat is not None and stat[1] == start_ticks and stat[0] != b'Z'
 
         try:
-            process = self.tracked_processes[session_id]['process']
-            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+            process = info['process']
+            # is_running() also compares create_time, so a reused PID reads as ended
+            if not process.is_running():
+                return False
+            return not _CHECK_ZOMBIES or process.status() != psutil.STATUS_ZOMBIE
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
 
@@ -156,19 +221,14 @@ class ProcessTracker:
         Returns:
             Runtime in seconds, 0 if not found or not running
         """
-        if session_id not in self.tracked_processes:
+        process_info = self.tracked_processes.get(session_id)
+        if process_info is None:
             return 0
 
         try:
-            process_info = self.tracked_processes[session_id]
-
-            if self.is_process_running(session_id):
-                runtime = time.time() - process_info['start_time']
-                return int(runtime)
-            else:
-                # Process ended, calculate final runtime
-                # Try to get process end time from process_info if available
-                return int(time.time() - process_info['start_time'])
+            # Running or just ended, the runtime is measured up to now (the exit
+            # time isn't recorded), so there's no need to query the process
+            return int(time.time() - process_info['start_time'])
         except Exception as e:
             print(f"[PROCESS_TRACKER] Error getting runtime: {e}")
             return 0
@@ -183,12 +243,14 @@ class ProcessTracker:
         Returns:
             Final runtime in seconds
         """
-        runtime = self.get_runtime(session_id)
+        # Runtime and removal happen together, so a concurrent stop can't
+        # report the session a second time
+        with self._lock:
+            runtime = self.get_runtime(session_id)
+            info = self.tracked_processes.pop(session_id, None)
 
-        if session_id in self.tracked_processes:
-            game_name = self.tracked_processes[session_id]['game_name']
-            print(f"[PROCESS_TRACKER] Stopped tracking {game_name}, runtime: {runtime}s")
-            del self.tracked_processes[session_id]
+        if info is not None:
+            print(f"[PROCESS_TRACKER] Stopped tracking {info['game_name']}, runtime: {runtime}s")
 
         return runtime
 
@@ -200,12 +262,19 @@ class ProcessTracker:
             Dict of {session_id: is_running}
         """
         status = {}
-        for session_id in list(self.tracked_processes.keys()):
-            status[session_id] = self.is_process_running(session_id)
+        with self._lock:
+            sessions = list(self.tracked_processes.items())
+        if not sessions:
+            return status
+
+        # One PID snapshot per poll; sessions whose PID is gone need no further syscalls
+        live_pids = set(psutil.pids())
+        for session_id, info in sessions:
+            status[session_id] = self.is_process_running(session_id, live_pids)
 
             # Auto-cleanup ended processes after reporting
             if not status[session_id]:
-                print(f"[PROCESS_TRACKER] Process ended: {self.tracked_processes[session_id]['game_name']}")
+                print(f"[PROCESS_TRACKER] Process ended: {info['game_name']}")
 
         return status
 
@@ -217,8 +286,11 @@ class ProcessTracker:
             List of session info dicts
         """
         active = []
-        for session_id, info in self.tracked_processes.items():
-            if self.is_process_running(session_id):
+        with self._lock:
+            sessions = list(self.tracked_processes.items())
+        live_pids = set(psutil.pids()) if sessions else None
+        for session_id, info in sessions:
+            if self.is_process_running(session_id, live_pids):
                 active.append({
                     'session_id': session_id,
                     'game_name': info['game_name'],
@@ -232,9 +304,10 @@ class ProcessTracker:
 _tracker = ProcessTracker()
 
 
-def start_tracking_session(session_id: int, exe_path: str, game_name: str) -> bool:
+def start_tracking_session(session_id: int, exe_path: str, game_name: str,
+                           pid: Optional[int] = None) -> bool:
     """Start tracking a game process"""
-    return _tracker.start_tracking(session_id, exe_path, game_name)
+    return _tracker.start_tracking(session_id, exe_path, game_name, pid)
 
 
 def is_session_running(session_id: int) -> bool:
@@ -3,23 +3,109 @@ Process Tracker Service - JSON IPC Interface for Electron
 Communicates via stdin/stdout using JSON messages
 """
 
+import os
 import sys
 import json
+import queue
+import select
 import time
 import threading
+import psutil
 from process_tracker import ProcessTracker
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Pipe writes up to this size are atomic, so a batch never reaches Electron
+# split across two reads (select has no PIPE_BUF on Windows)
+_PIPE_BUF = getattr(select, 'PIPE_BUF', 4096)
+
+
 class ProcessTrackerService:
     def __init__(self):
         self.tracker = ProcessTracker()
         self.running = True
-        self.monitor_interval = 2  # Check every 2 seconds for better responsiveness
+        self.monitor_interval = 2  # Check pending sessions every 2 seconds for better responsiveness
+        # Exits are signalled by per-session waiter threads; this periodic
+        # re-check is only a safety net
+        self.exit_check_interval = 30
+        # Waiter threads wake this often to see whether their session was stopped
+        self.waiter_timeout = 5
         self.pending_sessions = {}  # {session_id: {params, start_time, timeout}}
+        self._wakeup = threading.Event()
+        self._waiters = {}  # {session_id: token of the thread watching it}
+        self._unwatched = set()  # Sessions whose waiter failed; polled instead
+
+        # JSON lines for Electron are queued and written by one thread, so
+        # callers never wait on the stdout pipe; None stops the writer
+        self._out_q = queue.SimpleQueue()
+        self._stdout_fd = sys.stdout.fileno()
+        self._writer = threading.Thread(target=self._write_output, daemon=True, name="stdout-writer")
+        self._writer.start()
 
     def log(self, message):
         """Log to stderr to avoid interfering with JSON output"""
         print(f"[PROCESS_TRACKER_SERVICE] {message}", file=sys.stderr, flush=True)
 
+    def _write_output(self):
+        """
+        Writer thread: drain queued messages and write each batch with a single syscall
+
+        A batch holds as many messages as fit in _PIPE_BUF; a message that
+        doesn't fit starts the next batch (one larger than that goes alone).
+        """
+        carry = None
+        while True:
+            message = self._out_q.get() if carry is None else carry
+            carry = None
+            stop = False
+            payload = bytearray()
+            while True:
+                if message is None:
+                    stop = True
+                    break
+                if payload and len(payload) + len(message) + 1 > _PIPE_BUF:
+                    carry = message
+                    break
+                payload += message
+                payload += b'\n'
+                try:
+                    message = self._out_q.get_nowait()
+                except queue.Empty:
+                    break
+
+            view = memoryview(payload)
+            try:
+                while view:
+                    view = view[os.write(self._stdout_fd, view):]
+            except OSError as e:
+                self.log(f"Error writing to stdout: {e}")
+
+            if stop:
+                return
+
+    def close_output(self):
+        """Write any queued messages and stop the writer thread"""
+        self._out_q.put(None)
+        self._writer.join(timeout=5)
+
     def send_response(self, success, data=None, error=None):
         """Send JSON response to stdout"""
         response = {
@@ -28,7 +114,7 @@ class ProcessTrackerService:
             'error': error,
             'timestamp': time.time()
         }
-        print(json.dumps(response), flush=True)
+        self._out_q.put(_dumps(response))
 
     def send_notification(self, event_type, data):
         """Send async notification to Electron"""
@@ -38,7 +124,48 @@ class ProcessTrackerService:
             'data': data,
             'timestamp': time.time()
         }
-        print(json.dumps(notification), flush=True)
+        self._out_q.put(_dumps(notification))
+
+    def watch_session(self, session_id):
+        """
+        Wake the monitor thread as soon as a tracked process exits
+
+        psutil's Process.wait() blocks on the OS exit notification
+        (WaitForSingleObject on Windows, pidfd/kqueue on Linux/macOS), so the
+        waiter thread sleeps until the game actually ends.
+        """
+        info = self.tracker.tracked_processes.get(session_id)
+        if info is None:
+            return
+        process = info['process']
+        # A newer token (session restarted) or none (session stopped) tells
+        # an older waiter to exit
+        token = object()
+        self._waiters[session_id] = token
+        self._unwatched.discard(session_id)
+
+        def wait_for_exit():
+            while self.running and self._waiters.get(session_id) is token:
+                try:
+                    process.wait(timeout=self.waiter_timeout)
+                except psutil.TimeoutExpired:
+                    continue
+                except psutil.NoSuchProcess:
+                    pass  # Already gone
+                except Exception as e:
+                    # Inaccessible (e.g. an elevated game); the monitor polls it instead
+                    self.log(f"Cannot wait on session {session_id}: {e}")
+                    self._unwatched.add(session_id)
+                self._wakeup.set()
+                return
+
+        threading.Thread(target=wait_for_exit, daemon=True,
+                         name=f"process-exit-{session_id}").start()
+
+    def forget_session(self, session_id):
+        """Let a stopped session's waiter thread exit and stop polling for it"""
+        self._waiters.pop(session_id, None)
+        self._unwatched.discard(session_id)
 
     def handle_start_tracking(self, params):
         """Start tracking a game process"""
@@ -48,11 +175,13 @@ class ProcessTrackerService:
             game_name = params.get('game_name', 'Unknown Game')
             wait_for_process = params.get('wait_for_process', True)
             timeout = params.get('timeout', 300)  # Default 5 minutes timeout
+            pid = params.get('pid')  # Set when the caller spawned the game itself
 
             # Try to start tracking immediately
-            success = self.tracker.start_tracking(session_id, exe_path, game_name)
+            success = self.tracker.start_tracking(session_id, exe_path, game_name, pid)
 
             if success:
+                self.watch_session(session_id)
                 self.send_response(True, {
                     'tracking_started': True,
                     'session_id': session_id,
@@ -96,6 +225,7 @@ class ProcessTrackerService:
                 return
 
             runtime = self.tracker.stop_tracking(session_id)
+            self.forget_session(session_id)
             self.send_response(True, {
                 'session_id': session_id,
                 'runtime': runtime
@@ -175,12 +305,13 @@ class ProcessTrackerService:
                 continue
 
             # Try to start tracking
-            if self.tracker.start_tracking(session_id, exe_path, game_name):
+            if self.tracker.start_tracking(session_id, exe_path, game_name, params.get('pid')):
                 started_sessions.append((session_id, game_name))
 
         # Update pending list and notify
         for session_id, game_name in started_sessions:
             del self.pending_sessions[session_id]
+            self.watch_session(session_id)
             self.send_notification('tracking_started', {
                 'session_id': session_id,
                 'game_name': game_name
@@ -203,7 +334,12 @@ class ProcessTrackerService:
 
         while self.running:
             try:
-                time.sleep(self.monitor_interval)
+                # Sleep until a watched process exits; poll only while sessions
+                # are waiting for their process to appear or can't be waited on
+                poll = self.pending_sessions or self._unwatched
+                timeout = self.monitor_interval if poll else self.exit_check_interval
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
 
                 # Check active processes
                 status = self.tracker.check_all_processes()
@@ -218,6 +354,7 @@ class ProcessTrackerService:
                         })
                         # Stop tracking this session
                         self.tracker.stop_tracking(session_id)
+                        self.forget_session(session_id)
 
                 # Check pending sessions
                 self.check_pending_sessions()
@@ -246,6 +383,7 @@ class ProcessTrackerService:
             elif cmd == 'shutdown':
                 self.log("Shutdown command received")
                 self.running = False
+                self._wakeup.set()
                 self.send_response(True, {'message': 'shutting down'})
             else:
                 self.send_response(False, error=f"Unknown command: {cmd}")
@@ -267,26 +405,30 @@ class ProcessTrackerService:
 
         # Process commands from stdin
         try:
-            for line in sys.stdin:
-                if not line.strip():
+            # Commands are read as bytes; both parsers accept them, so no text decoding is needed
+            stdin = sys.stdin.buffer
+            while self.running:
+                line = stdin.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
                     continue
 
                 try:
-                    command = json.loads(line.strip())
+                    command = _loads(line)
                     self.handle_command(command)
                 except json.JSONDecodeError as e:
                     self.log(f"Invalid JSON: {e}")
                     self.send_response(False, error=f"Invalid JSON: {str(e)}")
 
-                if not self.running:
-                    break
-
         except KeyboardInterrupt:
             self.log("Received keyboard interrupt")
         except Exception as e:
             self.log(f"Error in main loop: {e}")
         finally:
             self.log("Service shutting down")
+            self.close_output()
 
 if __name__ == '__main__':
     service = ProcessTrackerService()
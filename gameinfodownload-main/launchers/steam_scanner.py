@@ -3,7 +3,6 @@ Steam Game Scanner
 Detects and extracts information about installed Steam games
 """
 import os
-import re
 import vdf
 import requests
 import shutil
@@ -11,6 +10,11 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import platform
 
+from .downloads import (asset_cache_entry, load_asset_cache, revalidation_headers,
+                        save_asset_cache, save_response)
+from .text import clean_description, safe_filename
+
+
 try:
     from .icon_extractor import extract_game_icon
     ICON_EXTRACTOR_AVAILABLE = True
@@ -21,6 +25,9 @@ except ImportError:
 class SteamScanner:
     """Scanner for Steam games"""
 
+    # URL and ETag/Last-Modified of each downloaded image, kept beside the image folders
+    ASSET_CACHE_FILE = 'steam_asset_cache.json'
+
     # Common Steam installation paths by platform
     STEAM_PATHS = {
         'Windows': [
@@ -49,6 +56,8 @@ class SteamScanner:
         """
         self.icons_dir = icons_dir
         self.boxart_dir = boxart_dir
+        self.asset_cache_path = self.icons_dir.parent / self.ASSET_CACHE_FILE
+        self._asset_cache = load_asset_cache(self.asset_cache_path)
         self.steam_path = self._find_steam_installation()
         self.library_folders = []
 
@@ -135,13 +144,8 @@ class SteamScanner:
 
                     # Use short_description as primary, clean HTML tags
                     short_desc = game_data.get('short_description', '')
-                    # Remove HTML tags
-                    short_desc = re.sub(r'<[^>]+>', '', short_desc)
-                    # Clean up extra whitespace
-                    short_desc = ' '.join(short_desc.split())
-                    # Limit to 300 characters for cleaner display
-                    if len(short_desc) > 300:
-                        short_desc = short_desc[:297] + '...'
+                    # Strip HTML tags and whitespace runs, limit to 300 characters
+                    short_desc = clean_description(short_desc)
 
                     metadata['description'] = short_desc
                     metadata['short_description'] = short_desc
@@ -234,24 +238,39 @@ class SteamScanner:
 
         return None
 
+    def _download_image(self, url: str, save_path: Path, relative_path: str) -> Optional[str]:
+        """
+        Download an image, revalidating an earlier copy with a conditional GET
+
+        Returns:
+            relative_path if the image is available locally, otherwise None
+        """
+        headers = revalidation_headers(self._asset_cache.get(relative_path), url, save_path)
+        if headers == {}:
+            return relative_path
+
+        with requests.get(url, headers=headers, stream=True, timeout=10) as response:
+            if response.status_code == 304:
+                return relative_path
+            if response.status_code != 200:
+                return None
+
+            save_response(response, save_path)
+            self._asset_cache[relative_path] = asset_cache_entry(url, response)
+
+            # Return relative path for URL construction
+            return relative_path
+
     def _download_icon(self, app_id: str, game_name: str) -> Optional[str]:
         """Download game icon"""
         try:
             # Steam icon URL format
             icon_url = f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/icon.jpg"
 
-            response = requests.get(icon_url, timeout=10)
-            if response.status_code == 200:
-                # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
-                filename = f"steam_{app_id}_{safe_name}.jpg"
-                icon_path = self.icons_dir / filename
-
-                with open(icon_path, 'wb') as f:
-                    f.write(response.content)
-
-                # Return relative path for URL construction
-                return f"game_data/icons/{filename}"
+            # Sanitize filename
+            safe_name = safe_filename(game_name)
+            filename = f"steam_{app_id}_{safe_name}.jpg"
+            return self._download_image(icon_url, self.icons_dir / filename, f"game_data/icons/{filename}")
 
         except Exception as e:
             print(f"Error downloading icon for {game_name}: {e}")
@@ -264,18 +283,10 @@ class SteamScanner:
             # Library card image (600x900 - vertical format, for grid view)
             boxart_url = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900.jpg"
 
-            response = requests.get(boxart_url, timeout=10)
-            if response.status_code == 200:
-                # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
-                filename = f"steam_{app_id}_{safe_name}_card.jpg"
-                boxart_path = self.boxart_dir / filename
-
-                with open(boxart_path, 'wb') as f:
-                    f.write(response.content)
-
-                # Return relative path for URL construction
-                return f"game_data/boxart/{filename}"
+            # Sanitize filename
+            safe_name = safe_filename(game_name)
+            filename = f"steam_{app_id}_{safe_name}_card.jpg"
+            return self._download_image(boxart_url, self.boxart_dir / filename, f"game_data/boxart/{filename}")
 
         except Exception as e:
             print(f"Error downloading box art for {game_name}: {e}")
@@ -288,18 +299,10 @@ class SteamScanner:
             # Header image (460x215 - horizontal format, for coverflow)
             header_url = f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/header.jpg"
 
-            response = requests.get(header_url, timeout=10)
-            if response.status_code == 200:
-                # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
-                filename = f"steam_{app_id}_{safe_name}_header.jpg"
-                header_path = self.boxart_dir / filename
-
-                with open(header_path, 'wb') as f:
-                    f.write(response.content)
-
-                # Return relative path for URL construction
-                return f"game_data/boxart/{filename}"
+            # Sanitize filename
+            safe_name = safe_filename(game_name)
+            filename = f"steam_{app_id}_{safe_name}_header.jpg"
+            return self._download_image(header_url, self.boxart_dir / filename, f"game_data/boxart/{filename}")
 
         except Exception as e:
             print(f"Error downloading header for {game_name}: {e}")
@@ -322,11 +325,18 @@ class SteamScanner:
         for library_path in self.library_folders:
             steamapps_path = library_path / 'steamapps'
 
-            if not steamapps_path.exists():
+            # Find all .acf files; DirEntry carries the file type, so no extra stat per entry
+            try:
+                with os.scandir(steamapps_path) as it:
+                    acf_files = [
+                        Path(entry.path) for entry in it
+                        if entry.name.startswith('appmanifest_') and entry.name.endswith('.acf')
+                        and entry.is_file()
+                    ]
+            except OSError:
                 continue
 
-            # Find all .acf files
-            for acf_file in steamapps_path.glob('appmanifest_*.acf'):
+            for acf_file in acf_files:
                 app_state = self._parse_acf_file(acf_file)
 
                 if not app_state:
@@ -384,7 +394,7 @@ class SteamScanner:
                     if install_dir and os.path.exists(install_dir):
                         print(f"  Extracting icon from executable for: {name}")
                         # Sanitize filename
-                        safe_name = re.sub(r'[<>:"/\\|?*]', '_', name)
+                        safe_name = safe_filename(name)
                         exe_icon_filename = f"steam_{app_id}_{safe_name}_exe.png"
                         exe_icon_file_path = self.icons_dir / exe_icon_filename
 
@@ -401,4 +411,9 @@ class SteamScanner:
 
                 games.append(game_info)
 
+        try:
+            save_asset_cache(self.asset_cache_path, self._asset_cache)
+        except OSError as e:
+            print(f"Error saving {self.asset_cache_path.name}: {e}")
+
         return games
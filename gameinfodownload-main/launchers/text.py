@@ -0,0 +1,37 @@
+"""
+Text helpers
+Shared by the launcher scanners for cleaning store descriptions and
+building artwork file names
+"""
+import re
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Characters not allowed in Windows filenames
+_UNSAFE_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Descriptions are cut to this many characters for cleaner display
+DESCRIPTION_LIMIT = 300
+
+
+def clean_description(text: str, limit: int = DESCRIPTION_LIMIT) -> str:
+    """
+    Strip HTML tags, collapse whitespace and truncate a store description
+
+    Args:
+        text: Raw description, possibly containing HTML
+        limit: Maximum length of the result, including the trailing '...'
+
+    Returns:
+        Plain-text description
+    """
+    # split()/join collapses whitespace faster than a second \s+ regex pass
+    text = ' '.join(_HTML_TAG_RE.sub('', text).split())
+    if len(text) > limit:
+        text = text[:limit - 3] + '...'
+    return text
+
+
+def safe_filename(name: str) -> str:
+    """Replace characters Windows doesn't allow in file names with '_'"""
+    return _UNSAFE_FILENAME_RE.sub('_', name)
@@ -14,6 +14,12 @@ from typing import List, Dict, Optional
 import platform
 import xml.etree.ElementTree as ET
 
+from .downloads import save_response
+from .text import clean_description, safe_filename
+
+# Version/architecture/publisher-hash suffix of a package family name
+_PACKAGE_SUFFIX_RE = re.compile(r'_\d+\.\d+\.\d+\.\d+_x64__\w+$')
+
 try:
     from .icon_extractor import extract_game_icon
     ICON_EXTRACTOR_AVAILABLE = True
@@ -107,7 +113,7 @@ class XboxScanner:
                         # Use game directory name as title (clean it up)
                         title = game_dir.name
                         # Remove version numbers and IDs
-                        title = re.sub(r'_\d+\.\d+\.\d+\.\d+_x64__\w+$', '', title)
+                        title = _PACKAGE_SUFFIX_RE.sub('', title)
                         title = title.replace('_', ' ')
 
                         # Look for icon files in the game directory
@@ -326,13 +332,8 @@ class XboxScanner:
                         # Extract metadata
                         props = product.get('LocalizedProperties', [{}])[0]
                         desc = props.get('ShortDescription', '') or props.get('ProductDescription', '')
-                        # Remove HTML tags
-                        desc = re.sub(r'<[^>]+>', '', desc)
-                        # Clean up extra whitespace
-                        desc = ' '.join(desc.split())
-                        # Limit to 300 characters for cleaner display
-                        if len(desc) > 300:
-                            desc = desc[:297] + '...'
+                        # Strip HTML tags and whitespace runs, limit to 300 characters
+                        desc = clean_description(desc)
 
                         metadata['description'] = desc
                         metadata['publisher'] = props.get('PublisherName', '')
@@ -362,25 +363,24 @@ class XboxScanner:
             if '?' not in image_url:
                 image_url += '?w=400&h=600'
 
-            response = requests.get(image_url, timeout=10)
-            if response.status_code == 200:
-                # Sanitize filename
-                safe_name = re.sub(r'[<>:"/\\|?*]', '_', app_name)
+            with requests.get(image_url, stream=True, timeout=10) as response:
+                if response.status_code == 200:
+                    # Sanitize filename
+                    safe_name = safe_filename(app_name)
 
-                if image_type == 'icon':
-                    filename = f"xbox_{safe_name}_icon.jpg"
-                    save_path = self.icons_dir / filename
-                    relative_path = f"game_data/icons/{filename}"
-                else:
-                    filename = f"xbox_{safe_name}_boxart.jpg"
-                    save_path = self.boxart_dir / filename
-                    relative_path = f"game_data/boxart/{filename}"
+                    if image_type == 'icon':
+                        filename = f"xbox_{safe_name}_icon.jpg"
+                        save_path = self.icons_dir / filename
+                        relative_path = f"game_data/icons/{filename}"
+                    else:
+                        filename = f"xbox_{safe_name}_boxart.jpg"
+                        save_path = self.boxart_dir / filename
+                        relative_path = f"game_data/boxart/{filename}"
 
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
+                    save_response(response, save_path)
 
-                # Return relative path for URL construction
-                return relative_path
+                    # Return relative path for URL construction
+                    return relative_path
 
         except Exception as e:
             print(f"Error downloading {image_type}: {e}")
@@ -393,7 +393,7 @@ class XboxScanner:
             return None
 
         try:
-            safe_name = re.sub(r'[<>:"/\\|?*]', '_', app_name)
+            safe_name = safe_filename(app_name)
             filename = f"xbox_{safe_name}_icon.png"
             dest_path = self.icons_dir / filename
 
@@ -427,7 +427,7 @@ class XboxScanner:
         # Process games from XboxGames directories
         for game_info in xboxgames_games:
             title = game_info.get('title', '')
-            safe_name = re.sub(r'[<>:"/\\|?*]', '_', title)
+            safe_name = safe_filename(title)
             icon_path = None
             boxart_path = None
 
@@ -549,7 +549,7 @@ class XboxScanner:
                 install_dir = game_info.get('install_directory', '')
                 if install_dir and os.path.exists(install_dir):
                     print(f"  Extracting icon from executable for: {display_name}")
-                    safe_name = re.sub(r'[<>:"/\\|?*]', '_', display_name)
+                    safe_name = safe_filename(display_name)
                     exe_icon_filename = f"xbox_{safe_name}_exe.png"
                     exe_icon_path = self.icons_dir / exe_icon_filename
 
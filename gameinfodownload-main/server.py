@@ -9,6 +9,7 @@ import json
 import os
 from pathlib import Path
 from game_scanner import GameScanner
+from launchers import start_console_logging
 
 app = Flask(__name__)
 # Enable CORS only for localhost to prevent security issues
@@ -103,9 +104,9 @@ def run_scan():
                     games = scanner.scanners[platform].scan_games()
                     all_games[platform] = games
 
-                    # Save games to database
-                    for game in games:
-                        scanner.db.save_game(game)
+                    # Save games to database in one transaction
+                    if games:
+                        scanner.db.save_games(games)
 
                     scan_state['total_games'] += len(games)
                     scan_state['message'] = f'Found {len(games)} {platform.title()} games'
@@ -392,6 +393,23 @@ def get_recently_added():
         return jsonify({'error': f'Failed to get recently added: {str(e)}'}), 500
 
 
+@app.route('/api/games/home', methods=['GET'])
+def get_home_lists():
+    """Get recently played, most played and recently added games together"""
+    try:
+        limit = request.args.get('limit', 10)
+        is_valid, validated_limit = validate_positive_int(limit, "limit", max_value=100)
+        if not is_valid:
+            return jsonify({'error': validated_limit}), 400
+
+        if scanner and scanner.db:
+            lists = scanner.db.get_home_lists(validated_limit)
+            return jsonify({'success': True, **lists})
+        return jsonify({'error': 'Scanner not initialized'}), 500
+    except Exception as e:
+        return jsonify({'error': f'Failed to get home lists: {str(e)}'}), 500
+
+
 @app.route('/api/games/duplicates', methods=['GET'])
 def find_duplicates():
     """Find duplicate games"""
@@ -431,6 +449,7 @@ def filter_games():
 if __name__ == '__main__':
     # Create data directory if it doesn't exist
     data_dir.mkdir(exist_ok=True)
+    start_console_logging()
 
     # Initialize scanner on startup to avoid race conditions
     print("Initializing game scanner...")
@@ -0,0 +1,88 @@
+"""
+Tests for the SQLite game database
+Run from gameinfodownload-main with: python -m unittest
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from data.storage import GameDatabase
+
+
+class BatchReadTest(unittest.TestCase):
+    """Reads inside batch() must see the transaction's own writes"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = GameDatabase(os.path.join(self.tmpdir.name, 'games.db'))
+        self.game_id = self.db.save_game({'platform': 'steam', 'title': 'Portal 2'})
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_read_inside_batch_sees_uncommitted_write(self):
+        with self.db.batch():
+            self.db.set_favorite(self.game_id, True)
+            self.assertEqual(self.db.get_game_by_id(self.game_id)['is_favorite'], 1)
+        self.assertEqual(self.db.get_game_by_id(self.game_id)['is_favorite'], 1)
+
+    def test_read_inside_batch_sees_new_game(self):
+        with self.db.batch():
+            self.db.save_game({'platform': 'epic', 'title': 'Hades'})
+            self.assertIsNotNone(self.db.get_game_by_title('Hades'))
+            self.assertEqual(self.db.count_games(), 2)
+
+    def test_rolled_back_batch_is_not_visible(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.batch():
+                self.db.set_favorite(self.game_id, True)
+                raise RuntimeError
+        self.assertEqual(self.db.get_game_by_id(self.game_id)['is_favorite'], 0)
+
+
+class SearchIndexTest(unittest.TestCase):
+    """games_fts must stay in step with games, including writes made elsewhere"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'games.db')
+        self.db = GameDatabase(self.path)
+        if not self.db.has_fts:
+            self.skipTest('SQLite built without FTS5')
+        self.db.save_games([{'platform': 'steam', 'title': f'Game {i}'} for i in range(5)])
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _index_rows(self):
+        with self.db._read_cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM games_fts_docsize')
+            return cursor.fetchone()[0]
+
+    def test_external_replace_is_repaired_on_open(self):
+        # The Electron app replaces rows without recursive triggers, so the
+        # delete trigger never sees the old row
+        self.db.close()
+        conn = sqlite3.connect(self.path)
+        conn.execute('PRAGMA recursive_triggers = OFF')
+        conn.execute("INSERT OR REPLACE INTO games (platform, title, description) "
+                     "VALUES ('steam', 'Game 0', 'replaced')")
+        conn.commit()
+        conn.close()
+
+        self.db = GameDatabase(self.path)
+        self.assertEqual(self._index_rows(), self.db.count_games())
+        self.assertEqual([g['title'] for g in self.db.search_games('replaced')], ['Game 0'])
+
+    def test_delete_removes_index_entry(self):
+        game = self.db.get_game_by_title('Game 3')
+        self.db.delete_game(game['id'])
+        self.assertEqual(self._index_rows(), 4)
+        self.assertEqual(self.db.search_games('game 3'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1349,9 +1349,15 @@ function initProcessTracker() {
 
         console.log('[PROCESS_TRACKER] Service started');
 
-        // Handle stdout (JSON responses and notifications)
+        // Handle stdout (JSON responses and notifications). A message can
+        // arrive split across 'data' events, so the trailing partial line is
+        // kept until the rest of it comes in
+        let stdoutBuffer = '';
+        processTrackerService.stdout.setEncoding('utf8');
         processTrackerService.stdout.on('data', (data) => {
-            const lines = data.toString().split('\n');
+            stdoutBuffer += data;
+            const lines = stdoutBuffer.split('\n');
+            stdoutBuffer = lines.pop();
             lines.forEach(line => {
                 if (!line.trim()) return;
 